@@ -19,6 +19,28 @@ from .real_evaluator import (
     benchmark_designs,
 )
 
+from .ab_testing import (
+    ABTest,
+    RollbackSafety,
+)
+
+from .performance_tracker import (
+    PerformanceTracker,
+)
+
+from .meta_learning_agent import (
+    MetaLearningAgent,
+)
+
+from .alma_trading_adapter_v2 import (
+    TradingMemory,
+)
+
+from .alma_consensus import (
+    ALMAConsensus,
+    get_consensus,
+)
+
 from .mutation_strategies import (
     MutationStrategy,
     GaussianMutation,
@@ -40,6 +62,23 @@ __all__ = [
     "RealALMAEvaluator",
     "benchmark_designs",
 
+    # A/B testing
+    "ABTest",
+    "RollbackSafety",
+
+    # Performance tracking
+    "PerformanceTracker",
+
+    # Code-based meta-learning
+    "MetaLearningAgent",
+
+    # Trading memory
+    "TradingMemory",
+
+    # Consensus
+    "ALMAConsensus",
+    "get_consensus",
+
     # Mutations
     "MutationStrategy",
     "GaussianMutation",
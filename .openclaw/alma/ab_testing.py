@@ -0,0 +1,696 @@
+"""
+A/B Testing Framework for ALMA designs.
+
+Compares design variants on live metrics and provides rollback safety
+for deployments whose performance degrades.
+
+Part of the Phase 2 roadmap ("Real-World Evaluation").
+"""
+
+import math
+import random
+import sqlite3
+import statistics
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+from datetime import datetime
+
+# NumPy is optional: its C reduction loops beat statistics.mean/stdev on
+# large raw-sample arrays, but everything degrades gracefully without it.
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# Connection tuning applied once per connection: WAL allows readers to
+# proceed concurrent with a writer, synchronous=NORMAL drops the fsync per
+# commit that FULL pays, and the remaining pragmas keep hot pages in memory.
+_TUNING_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA busy_timeout=5000",
+)
+
+
+def _tune_connection(conn: sqlite3.Connection):
+    """Apply performance pragmas to a freshly opened connection."""
+    for pragma in _TUNING_PRAGMAS:
+        conn.execute(pragma)
+
+
+# Hot-path SQL promoted to module constants: Python's sqlite3 statement
+# cache keys on the query string, so reusing the exact same object makes
+# every call after the first skip parse/prepare entirely.
+_SQL_INSERT_METRIC = """
+    INSERT INTO metrics (test_id, variant, metric_name, metric_value, timestamp)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+_SQL_BUMP_STATS = """
+    INSERT INTO metric_stats (test_id, variant, n, total, total_sq)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(test_id, variant) DO UPDATE SET
+        n = n + excluded.n,
+        total = total + excluded.total,
+        total_sq = total_sq + excluded.total_sq
+"""
+
+# RollbackSafety SQL carries a {schema} slot so the same statements work
+# whether the safety tables live in their own database ("main") or are
+# ATTACHed to a shared connection. Formatted once per instance, so the
+# statement cache still hits on a stable string.
+_SQL_INSERT_HISTORY = """
+    INSERT INTO {schema}.metrics_history (deployment_id, value, timestamp)
+    VALUES (?, ?, ?)
+"""
+
+_SQL_CHECK_DEGRADATION = """
+    WITH recent AS (
+        SELECT AVG(value) AS avg_v, COUNT(*) AS cnt FROM (
+            SELECT value FROM {schema}.metrics_history
+            WHERE deployment_id = ?1
+            ORDER BY timestamp DESC
+            LIMIT 5
+        )
+    )
+    SELECT d.baseline_score, recent.avg_v, recent.cnt
+    FROM {schema}.deployments d, recent
+    WHERE d.deployment_id = ?1 AND d.status = 'active'
+"""
+
+
+def _now_us() -> int:
+    """Current time as integer epoch microseconds.
+
+    8-byte INTEGER timestamps write and sort faster than 26-char ISO
+    strings; convert for display with datetime.fromtimestamp(ts / 1e6).
+    """
+    return time.time_ns() // 1000
+
+
+class ABTest:
+    """
+    A/B test between two design variants.
+
+    Records per-variant metric samples and analyzes which variant wins.
+    Holds a single long-lived connection; use close() or a with-block in
+    long-running processes.
+    """
+
+    __slots__ = ("test_name", "db_path", "_conn")
+
+    def __init__(
+        self,
+        test_name: str = "alma_ab_test",
+        db_path: str = ".openclaw/ab_tests.db"
+    ):
+        """
+        Initialize A/B test.
+
+        Args:
+            test_name: Human-readable test name
+            db_path: Path to A/B tests database
+        """
+        self.test_name = test_name
+        self.db_path = db_path
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, cached_statements=256
+        )
+        _tune_connection(self._conn)
+        self._init_database()
+
+    def close(self):
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _init_database(self):
+        """Initialize database for A/B test metrics."""
+        cursor = self._conn.cursor()
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS metrics (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                test_id TEXT NOT NULL,
+                variant TEXT NOT NULL,
+                metric_name TEXT NOT NULL,
+                metric_value REAL NOT NULL,
+                timestamp INTEGER NOT NULL
+            )
+        """)
+
+        # Composite index serves both the WHERE filter and the ORDER BY in
+        # get_variant_metrics, avoiding a table scan plus temp-btree sort.
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_metrics_test_variant_ts
+            ON metrics(test_id, variant, timestamp)
+        """)
+
+        # Denormalized running sums per (test, variant), maintained in the
+        # same transaction as each insert so analyze_results is O(1)
+        # regardless of sample count.
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS metric_stats (
+                test_id TEXT NOT NULL,
+                variant TEXT NOT NULL,
+                n INTEGER NOT NULL,
+                total REAL NOT NULL,
+                total_sq REAL NOT NULL,
+                PRIMARY KEY (test_id, variant)
+            )
+        """)
+
+        self._conn.commit()
+
+    def _bump_stats(self, test_id: str, variant: str, values: List[float]):
+        """Fold new samples into the running (n, sum, sumsq) row."""
+        n = len(values)
+        s = sum(values)
+        s2 = sum(v * v for v in values)
+        self._conn.execute(_SQL_BUMP_STATS, (test_id, variant, n, s, s2))
+
+    def record_metric(
+        self,
+        test_id: str,
+        variant: str,
+        metric_name: str,
+        value: float
+    ):
+        """Record a single metric sample for a variant."""
+        self._conn.execute(
+            _SQL_INSERT_METRIC,
+            (test_id, variant, metric_name, value, _now_us()),
+        )
+        self._bump_stats(test_id, variant, [value])
+        self._conn.commit()
+
+    def record_metrics(
+        self,
+        test_id: str,
+        variant: str,
+        metric_name: str,
+        values: List[float]
+    ):
+        """
+        Record many metric samples in one transaction.
+
+        Bulk path for real workloads: a single BEGIN/COMMIT around an
+        executemany removes the per-statement journal/fsync cost that
+        record_metric pays on every call.
+        """
+        if not values:
+            return
+
+        ts = _now_us()
+        self._conn.executemany(
+            _SQL_INSERT_METRIC,
+            [(test_id, variant, metric_name, v, ts) for v in values],
+        )
+        self._bump_stats(test_id, variant, values)
+        self._conn.commit()
+
+    def record_metrics_bulk(
+        self,
+        test_id: str,
+        variant: str,
+        metric_name: str,
+        values
+    ):
+        """
+        Bulk-ingest samples from any iterable of numbers.
+
+        Accepts lists, tuples, generators, or NumPy arrays; values are
+        coerced to float so np.float64 scalars are stored as plain REALs.
+        One executemany inside a single transaction, so ingest cost is
+        one commit regardless of sample count.
+        """
+        ts = _now_us()
+        rows = [(test_id, variant, metric_name, float(v), ts) for v in values]
+        if not rows:
+            return
+
+        with self._conn:
+            self._conn.executemany(_SQL_INSERT_METRIC, rows)
+            self._bump_stats(test_id, variant, [r[3] for r in rows])
+
+    # Rows per multi-row INSERT. 100 rows x 5 columns = 500 bound
+    # parameters, safely under SQLite's default 999-variable limit.
+    _MULTIROW_CHUNK = 100
+
+    def record_metrics_multirow(
+        self,
+        test_id: str,
+        variant: str,
+        metric_name: str,
+        values
+    ):
+        """
+        Fastest ingest path: multi-row INSERT ... VALUES per chunk.
+
+        A single statement inserting 100 rows at a time avoids the
+        per-row statement dispatch that even executemany pays, leaving
+        ingestion bandwidth-limited rather than CPU-bound.
+        """
+        ts = _now_us()
+        rows = [(test_id, variant, metric_name, float(v), ts) for v in values]
+        if not rows:
+            return
+
+        chunk = self._MULTIROW_CHUNK
+        base = ("INSERT INTO metrics "
+                "(test_id, variant, metric_name, metric_value, timestamp) VALUES ")
+        full_sql = base + ",".join(["(?,?,?,?,?)"] * chunk)
+
+        with self._conn:
+            for start in range(0, len(rows), chunk):
+                batch = rows[start:start + chunk]
+                if len(batch) == chunk:
+                    sql = full_sql
+                else:
+                    sql = base + ",".join(["(?,?,?,?,?)"] * len(batch))
+                params = [p for row in batch for p in row]
+                self._conn.execute(sql, params)
+            self._bump_stats(test_id, variant, [r[3] for r in rows])
+
+    def get_variant_metrics(
+        self,
+        test_id: str,
+        variant: str,
+        metric_name: Optional[str] = None
+    ) -> List[float]:
+        """Get metric values for a variant."""
+        cursor = self._conn.cursor()
+
+        if metric_name:
+            cursor.execute("""
+                SELECT metric_value FROM metrics
+                WHERE test_id = ? AND variant = ? AND metric_name = ?
+                ORDER BY timestamp
+            """, (test_id, variant, metric_name))
+        else:
+            cursor.execute("""
+                SELECT metric_value FROM metrics
+                WHERE test_id = ? AND variant = ?
+                ORDER BY timestamp
+            """, (test_id, variant))
+
+        return [row[0] for row in cursor.fetchall()]
+
+    def variant_distribution(
+        self,
+        test_id: str,
+        variant: str,
+        metric_name: Optional[str] = None
+    ) -> Dict:
+        """
+        Full distribution stats for a variant's raw samples.
+
+        Unlike analyze_results, this pulls the raw array so percentiles can
+        be computed. Uses NumPy's C reductions when available instead of the
+        pure-Python statistics module.
+
+        Returns:
+            Dictionary with mean, std, percentiles and sample count
+        """
+        if metric_name:
+            cursor = self._conn.execute("""
+                SELECT metric_value FROM metrics
+                WHERE test_id = ? AND variant = ? AND metric_name = ?
+            """, (test_id, variant, metric_name))
+        else:
+            cursor = self._conn.execute("""
+                SELECT metric_value FROM metrics
+                WHERE test_id = ? AND variant = ?
+            """, (test_id, variant))
+
+        if NUMPY_AVAILABLE:
+            arr = np.fromiter((row[0] for row in cursor), dtype=np.float64)
+            if arr.size == 0:
+                return {"variant": variant, "samples": 0}
+            p25, p50, p75 = np.percentile(arr, (25, 50, 75))
+            return {
+                "variant": variant,
+                "samples": int(arr.size),
+                "mean": float(arr.mean()),
+                "std": float(arr.std(ddof=1)) if arr.size > 1 else 0.0,
+                "p25": float(p25),
+                "p50": float(p50),
+                "p75": float(p75),
+            }
+
+        values = sorted(row[0] for row in cursor)
+        if not values:
+            return {"variant": variant, "samples": 0}
+
+        def _percentile(pct: float) -> float:
+            idx = (len(values) - 1) * pct
+            lo = int(idx)
+            hi = min(lo + 1, len(values) - 1)
+            return values[lo] + (values[hi] - values[lo]) * (idx - lo)
+
+        return {
+            "variant": variant,
+            "samples": len(values),
+            "mean": statistics.mean(values),
+            "std": statistics.stdev(values) if len(values) > 1 else 0.0,
+            "p25": _percentile(0.25),
+            "p50": _percentile(0.50),
+            "p75": _percentile(0.75),
+        }
+
+    def analyze_results(
+        self,
+        test_id: str,
+        variant_a: str = "A",
+        variant_b: str = "B"
+    ) -> Dict:
+        """
+        Analyze A/B test results.
+
+        Returns:
+            Dictionary with per-variant stats and winner
+        """
+        # O(1) read of the running sums maintained at ingest time; fall
+        # back to aggregating the raw metrics table for databases written
+        # before metric_stats existed.
+        cursor = self._conn.execute("""
+            SELECT variant, n, total, total_sq FROM metric_stats
+            WHERE test_id = ? AND variant IN (?, ?)
+        """, (test_id, variant_a, variant_b))
+        rows = cursor.fetchall()
+        if not rows:
+            cursor = self._conn.execute("""
+                SELECT variant, COUNT(*), SUM(metric_value), SUM(metric_value * metric_value)
+                FROM metrics
+                WHERE test_id = ? AND variant IN (?, ?)
+                GROUP BY variant
+            """, (test_id, variant_a, variant_b))
+            rows = cursor.fetchall()
+
+        stats = {}
+        for variant, n, s, s2 in rows:
+            mean = s / n
+            var = (s2 - s * s / n) / (n - 1) if n > 1 else 0.0
+            stats[variant] = {
+                "mean": mean,
+                "std": math.sqrt(max(var, 0.0)),
+                "samples": n,
+            }
+
+        if variant_a not in stats or variant_b not in stats:
+            return {
+                "test_id": test_id,
+                "status": "insufficient_data",
+                "samples_a": stats.get(variant_a, {}).get("samples", 0),
+                "samples_b": stats.get(variant_b, {}).get("samples", 0),
+            }
+
+        a_mean = stats[variant_a]["mean"]
+        b_mean = stats[variant_b]["mean"]
+
+        winner = variant_a if a_mean >= b_mean else variant_b
+        baseline = min(a_mean, b_mean)
+        improvement = abs(a_mean - b_mean) / baseline * 100 if baseline else 0.0
+
+        return {
+            "test_id": test_id,
+            "status": "complete",
+            "variant_a": stats[variant_a],
+            "variant_b": stats[variant_b],
+            "winner": winner,
+            "improvement_pct": round(improvement, 2),
+        }
+
+
+class RollbackSafety:
+    """
+    Deployment safety monitor.
+
+    Tracks a baseline score per deployment and rolls back when recent
+    metrics degrade past a threshold. Holds a single long-lived connection;
+    use close() or a with-block in long-running processes.
+    """
+
+    __slots__ = (
+        "db_path", "degradation_threshold", "_conn", "_schema",
+        "_owns_conn", "_sql_insert_history", "_sql_check_degradation",
+    )
+
+    def __init__(
+        self,
+        db_path: str = ".openclaw/rollback_safety.db",
+        degradation_threshold: float = 0.10,
+        conn: Optional[sqlite3.Connection] = None,
+        schema: str = "main"
+    ):
+        """
+        Initialize rollback safety monitor.
+
+        Args:
+            db_path: Path to safety database
+            degradation_threshold: Fractional drop from baseline that triggers rollback
+            conn: Existing connection with the safety database ATTACHed
+                  (see open_shared); opens a dedicated one when omitted
+            schema: Schema name the safety tables live under
+        """
+        self.db_path = db_path
+        self.degradation_threshold = degradation_threshold
+        self._schema = schema
+        self._sql_insert_history = _SQL_INSERT_HISTORY.format(schema=schema)
+        self._sql_check_degradation = _SQL_CHECK_DEGRADATION.format(schema=schema)
+
+        if conn is not None:
+            self._conn = conn
+            self._owns_conn = False
+        else:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                self.db_path, check_same_thread=False, cached_statements=256
+            )
+            _tune_connection(self._conn)
+            self._owns_conn = True
+        self._init_database()
+
+    def close(self):
+        """Close the underlying database connection (if owned)."""
+        if self._owns_conn:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _init_database(self):
+        """Initialize database for deployment tracking."""
+        cursor = self._conn.cursor()
+        schema = self._schema
+
+        cursor.execute(f"""
+            CREATE TABLE IF NOT EXISTS {schema}.deployments (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                deployment_id TEXT NOT NULL,
+                design_id TEXT,
+                baseline_score REAL NOT NULL,
+                status TEXT DEFAULT 'active',
+                timestamp INTEGER NOT NULL
+            )
+        """)
+
+        cursor.execute(f"""
+            CREATE TABLE IF NOT EXISTS {schema}.metrics_history (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                deployment_id TEXT NOT NULL,
+                value REAL NOT NULL,
+                timestamp INTEGER NOT NULL
+            )
+        """)
+
+        cursor.execute(f"""
+            CREATE INDEX IF NOT EXISTS {schema}.idx_deployments_id
+            ON deployments(deployment_id)
+        """)
+
+        cursor.execute(f"""
+            CREATE INDEX IF NOT EXISTS {schema}.idx_metrics_history_dep_ts
+            ON metrics_history(deployment_id, timestamp DESC)
+        """)
+
+        self._conn.commit()
+
+    def record_deployment(
+        self,
+        deployment_id: str,
+        design_id: str,
+        baseline_score: float
+    ):
+        """Record a new active deployment with its baseline score."""
+        self._conn.execute(f"""
+            INSERT INTO {self._schema}.deployments
+                (deployment_id, design_id, baseline_score, status, timestamp)
+            VALUES (?, ?, ?, 'active', ?)
+        """, (deployment_id, design_id, baseline_score, _now_us()))
+        self._conn.commit()
+
+    def record_metric(self, deployment_id: str, value: float):
+        """Record a single post-deployment metric sample."""
+        self._conn.execute(
+            self._sql_insert_history, (deployment_id, value, _now_us())
+        )
+        self._conn.commit()
+
+    def record_metrics(self, deployment_id: str, values: List[float]):
+        """Record many post-deployment samples in one transaction."""
+        if not values:
+            return
+
+        ts = _now_us()
+        self._conn.executemany(
+            self._sql_insert_history, [(deployment_id, v, ts) for v in values]
+        )
+        self._conn.commit()
+
+    def check_degradation(self, deployment_id: str) -> Dict:
+        """
+        Check whether a deployment has degraded past the threshold.
+
+        Returns:
+            Dictionary with degradation status and scores
+        """
+        # Baseline lookup and recent average merged into one CTE query:
+        # a single round-trip per check instead of two. The inner query is
+        # an index range scan of the five newest samples; COUNT(*) rides
+        # along so the empty case needs no NULL sentinel.
+        cursor = self._conn.execute(self._sql_check_degradation, (deployment_id,))
+        row = cursor.fetchone()
+
+        if not row:
+            return {"deployment_id": deployment_id, "status": "not_found"}
+
+        baseline, current_avg, sample_count = row
+
+        if not sample_count:
+            return {
+                "deployment_id": deployment_id,
+                "status": "no_metrics",
+                "baseline": baseline,
+            }
+
+        drop = (baseline - current_avg) / baseline if baseline else 0.0
+
+        return {
+            "deployment_id": deployment_id,
+            "status": "active",
+            "baseline": baseline,
+            "current_avg": current_avg,
+            "drop_pct": round(drop * 100, 2),
+            "degraded": drop > self.degradation_threshold,
+        }
+
+    def rollback_deployment(self, deployment_id: str) -> bool:
+        """Mark a deployment as rolled back."""
+        cursor = self._conn.cursor()
+        cursor.execute(f"""
+            UPDATE {self._schema}.deployments
+            SET status = 'rolled_back'
+            WHERE deployment_id = ? AND status = 'active'
+        """, (deployment_id,))
+        changed = cursor.rowcount > 0
+        self._conn.commit()
+        return changed
+
+
+def open_shared(
+    ab_db_path: str = ".openclaw/ab_tests.db",
+    safety_db_path: str = ".openclaw/rollback_safety.db",
+    degradation_threshold: float = 0.10
+):
+    """
+    Open ABTest and RollbackSafety on one shared connection.
+
+    ATTACHes the safety database to the A/B connection so a process uses
+    a single file descriptor, one WAL, and one busy_timeout domain for
+    both — a single writer serializes cleanly instead of two independent
+    connections thrashing locks.
+
+    Returns:
+        (ABTest, RollbackSafety) tuple sharing one connection; closing
+        the ABTest closes both.
+    """
+    ab = ABTest(db_path=ab_db_path)
+    Path(safety_db_path).parent.mkdir(parents=True, exist_ok=True)
+    ab._conn.execute("ATTACH DATABASE ? AS safety", (safety_db_path,))
+    safety = RollbackSafety(
+        db_path=safety_db_path,
+        degradation_threshold=degradation_threshold,
+        conn=ab._conn,
+        schema="safety",
+    )
+    return ab, safety
+
+
+def example_ab_testing():
+    """Example A/B test with rollback safety."""
+    print("🐺📿 ALMA A/B Testing Example")
+    print("=" * 60)
+
+    ab = ABTest(test_name="design_comparison")
+    test_id = "design_v1_vs_v2"
+
+    # Accumulate samples and flush via the multi-row INSERT fast path
+    print("\n📊 Recording metrics...")
+    a_samples = [round(random.uniform(80.0, 90.0), 2) for _ in range(20)]
+    b_samples = [round(random.uniform(84.0, 94.0), 2) for _ in range(20)]
+    ab.record_metrics_multirow(test_id, "A", "score", a_samples)
+    ab.record_metrics_multirow(test_id, "B", "score", b_samples)
+
+    # Analyze
+    results = ab.analyze_results(test_id)
+    print(f"\n🏆 Winner: variant {results['winner']}")
+    print(f"   A: {results['variant_a']['mean']:.2f} ± {results['variant_a']['std']:.2f}")
+    print(f"   B: {results['variant_b']['mean']:.2f} ± {results['variant_b']['std']:.2f}")
+    print(f"   Improvement: {results['improvement_pct']}%")
+
+    # Rollback safety
+    print("\n🛡️ Rollback safety check...")
+    safety = RollbackSafety()
+    safety.record_deployment("deploy-001", "design_v2", baseline_score=88.0)
+    safety.record_metrics("deploy-001", [round(random.uniform(70.0, 80.0), 2) for _ in range(10)])
+
+    check = safety.check_degradation("deploy-001")
+    print(f"   Baseline: {check['baseline']:.2f}")
+    print(f"   Current: {check['current_avg']:.2f}")
+    print(f"   Degraded: {check['degraded']}")
+
+    if check["degraded"]:
+        safety.rollback_deployment("deploy-001")
+        print("   ⏪ Deployment rolled back")
+
+    ab.close()
+    safety.close()
+
+    print("\n✅ A/B testing example complete")
+
+
+__all__ = [
+    "ABTest",
+    "RollbackSafety",
+    "open_shared",
+]
+
+
+if __name__ == "__main__":
+    example_ab_testing()
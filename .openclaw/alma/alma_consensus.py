@@ -0,0 +1,228 @@
+"""
+ALMA Consensus for V7 strategy voting.
+
+Combines per-strategy signals into a weighted consensus vote, using
+ALMA-learned dynamic weights when trading memory is available and
+falling back to static equal weights otherwise.
+"""
+
+import functools
+import math
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+# Dynamic weights come from the trading memory adapter when it is
+# importable; without it we stay on static equal weights.
+try:
+    from .alma_trading_adapter_v2 import TradingMemory
+    TRADING_MEMORY_AVAILABLE = True
+except ImportError:
+    TradingMemory = None
+    TRADING_MEMORY_AVAILABLE = False
+
+# The V7 strategy roster is a fixed compile-time constant, mirrored from
+# V7ALMAIntegration.v7_strategies.
+STRATEGIES = (
+    "trend_capture_pro",
+    "supertrend_nova_cloud",
+    "volatility_breakout_system",
+    "selective_momentum_swing",
+    "divergence_volatility_enhanced",
+    "momentum_convergence_strategy",
+    "adaptive_range_strategy",
+    "multi_timeframe_rsi",
+    "bollinger_breakout_strategy",
+    "tvscreener",
+    "liquidator_indicator",
+    "renaissance_ai",
+)
+
+# Equal weights over the full roster, built once at import time so the
+# common get_weights call never rebuilds the dict.
+_EQUAL_WEIGHTS_ALL = {s: 1.0 / len(STRATEGIES) for s in STRATEGIES}
+
+
+@functools.lru_cache(maxsize=64)
+def _equal_weights(active: frozenset) -> Dict[str, float]:
+    """Equal weights for a subset of strategies, cached per subset.
+
+    The returned dict is shared between callers and must be treated as
+    immutable; copy before mutating.
+    """
+    if not active:
+        return {}
+    weight = 1.0 / len(active)
+    return {s: weight for s in active}
+
+
+class ALMAConsensus:
+    """
+    Weighted consensus voting over V7 strategies.
+
+    Uses dynamic weights from trading memory when available, otherwise
+    static equal weights.
+    """
+
+    def __init__(self, db_path: str = ".openclaw/trading_memory.db"):
+        """
+        Initialize consensus engine.
+
+        Args:
+            db_path: Path to trading memory database (if available)
+        """
+        self.db_path = db_path
+        self.memory = TradingMemory(db_path) if TRADING_MEMORY_AVAILABLE else None
+        # Short-TTL memo of dynamic weights: the active-strategy set
+        # changes rarely, so most votes become a dict lookup instead of a
+        # DB-backed recomputation.
+        self._weights_cache: Dict[Tuple, Tuple[float, Dict[str, float]]] = {}
+        self._weights_ttl = 30.0
+
+    def get_weights(
+        self,
+        active_strategies: Optional[List[str]] = None,
+        market_regime: Optional[str] = None
+    ) -> Dict[str, float]:
+        """
+        Get per-strategy weights.
+
+        Args:
+            active_strategies: Subset of strategies in play (default: all)
+            market_regime: Current market regime, passed to trading memory
+
+        Returns:
+            Dictionary mapping strategy name to weight (sums to 1.0)
+        """
+        if self.memory is not None:
+            key = (
+                frozenset(active_strategies) if active_strategies is not None else None,
+                market_regime,
+            )
+            now = time.monotonic()
+            cached = self._weights_cache.get(key)
+            if cached is not None and now - cached[0] < self._weights_ttl:
+                return cached[1]
+
+            try:
+                weights = self.memory.compute_dynamic_weights(
+                    active_strategies, market_regime
+                )
+                if weights:
+                    self._weights_cache[key] = (now, weights)
+                    return weights
+            except Exception:
+                pass  # fall through to static weights
+
+        if active_strategies is None:
+            return _EQUAL_WEIGHTS_ALL
+        return _equal_weights(frozenset(active_strategies))
+
+    def record_performance(self, *args, **kwargs):
+        """
+        Record strategy performance in trading memory.
+
+        Invalidates the dynamic-weight cache so the next vote sees the
+        new data.
+        """
+        if self.memory is None:
+            return
+        self.memory.update_strategy_performance(*args, **kwargs)
+        self._weights_cache.clear()
+
+    def compute_weighted_vote(
+        self,
+        signals: Dict[str, float],
+        market_regime: Optional[str] = None
+    ) -> float:
+        """
+        Compute the weighted consensus vote for a set of signals.
+
+        Args:
+            signals: Mapping of strategy name to signal in [-1, 1]
+            market_regime: Current market regime
+
+        Returns:
+            Weighted vote in [-1, 1]
+        """
+        if not signals:
+            return 0.0
+
+        weights = self.get_weights(list(signals.keys()), market_regime)
+
+        # Single fused loop over signals; the default is hoisted out and
+        # math.fsum keeps the accumulation numerically exact.
+        default = 1.0 / len(signals)
+        if weights.keys() == signals.keys():
+            vote = math.fsum(
+                weights[s] * signal for s, signal in signals.items()
+            )
+            total = math.fsum(weights.values())
+        else:
+            pairs = [
+                (weights.get(s, default), signal)
+                for s, signal in signals.items()
+            ]
+            vote = math.fsum(w * signal for w, signal in pairs)
+            total = math.fsum(w for w, _ in pairs)
+
+        return vote / total if total else 0.0
+
+
+_consensus: Optional[ALMAConsensus] = None
+_consensus_lock = threading.Lock()
+
+
+def get_consensus(
+    db_path: str = ".openclaw/trading_memory.db",
+    force_refresh: bool = False
+) -> ALMAConsensus:
+    """Get the shared ALMAConsensus instance.
+
+    Double-checked initialization: the hot path is a single module-global
+    load with no lock; the lock is only taken when the instance must be
+    (re)built, so two racing threads cannot each open a DB connection.
+    """
+    global _consensus
+    if _consensus is None or force_refresh:
+        with _consensus_lock:
+            if _consensus is None or force_refresh:
+                _consensus = ALMAConsensus(db_path)
+    return _consensus
+
+
+def example_consensus():
+    """Example of ALMA consensus voting."""
+    print("🐺📿 ALMA Consensus Example")
+    print("=" * 60)
+
+    consensus = get_consensus()
+
+    print(f"\n📊 Trading memory available: {TRADING_MEMORY_AVAILABLE}")
+
+    weights = consensus.get_weights()
+    print(f"\n⚖️  Full-roster weights ({len(weights)} strategies):")
+    for strategy, weight in list(weights.items())[:4]:
+        print(f"   {strategy}: {weight:.4f}")
+
+    signals = {
+        "trend_capture_pro": 1.0,
+        "supertrend_nova_cloud": 0.5,
+        "volatility_breakout_system": -0.5,
+    }
+    vote = consensus.compute_weighted_vote(signals)
+    print(f"\n🗳️  Weighted vote: {vote:+.4f}")
+
+    print("\n✅ ALMA consensus example complete")
+
+
+if __name__ == "__main__":
+    example_consensus()
+
+
+__all__ = [
+    "STRATEGIES",
+    "TRADING_MEMORY_AVAILABLE",
+    "ALMAConsensus",
+    "get_consensus",
+]
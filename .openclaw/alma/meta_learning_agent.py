@@ -0,0 +1,545 @@
+"""
+Meta-Learning Agent over code-based memory designs.
+
+Unlike ALMAAgent (parameter-dict designs), this agent evolves actual
+Python code: each design is a `process_items` implementation that is
+mutated, executed against synthetic workloads, scored, and archived.
+"""
+
+import hashlib
+import json
+import sqlite3
+import zlib
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# orjson serializes straight to bytes several times faster than stdlib
+# json; fall back transparently when it is not installed.
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# numpy holds the workload columns contiguously when present; plain
+# lists serve the same role otherwise.
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+def _dumps(obj) -> bytes:
+    """Serialize metadata to bytes for BLOB storage."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _loads(data) -> Dict:
+    """Deserialize metadata bytes (empty dict for NULL/legacy rows)."""
+    if not data:
+        return {}
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Seed implementation every archive starts from.
+DEFAULT_DESIGN_CODE = '''\
+def process_items(items):
+    """Select and summarize the highest-priority items."""
+    threshold = 0.5
+    keep_top = 50
+    selected = [it for it in items if it["priority"] >= threshold]
+    selected.sort(key=lambda it: it["priority"], reverse=True)
+    kept = selected[:keep_top]
+    total = 0.0
+    for it in kept:
+        total += it["value"]
+    return {"kept": len(kept), "total": total}
+'''
+
+# Code mutations: (description, old, new) string rewrites applied to a
+# parent design to produce a child.
+_MUTATIONS = [
+    ("lower threshold", "threshold = 0.5", "threshold = 0.3"),
+    ("raise threshold", "threshold = 0.5", "threshold = 0.7"),
+    ("keep fewer items", "keep_top = 50", "keep_top = 25"),
+    ("keep more items", "keep_top = 50", "keep_top = 100"),
+]
+
+
+# Score weights for (accuracy, speed, memory_efficiency, adaptability),
+# fixed at module scope so compute_score allocates nothing per call.
+_DEFAULT_WEIGHTS = (0.4, 0.2, 0.2, 0.2)
+
+# Shared by the single-row and bulk save paths.
+_SQL_INSERT_DESIGN = """
+    INSERT OR REPLACE INTO designs
+        (design_id, code, score, accuracy, speed,
+         memory_efficiency, adaptability, created_at, metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+@dataclass(slots=True)
+class Performance:
+    """Measured performance dimensions of a design.
+
+    Slotted attributes make the score computation C-level attribute
+    fetches instead of string-hashed dict lookups.
+    """
+    accuracy: float = 0.0
+    speed: float = 0.0
+    memory_efficiency: float = 0.0
+    adaptability: float = 0.0
+
+
+class MemoryDesign:
+    """A code-based memory design with measured performance."""
+
+    __slots__ = ("design_id", "code", "metadata", "_score_cache", "_performance")
+
+    def __init__(
+        self,
+        design_id: str,
+        code: str,
+        performance: Optional[Performance] = None,
+        metadata: Optional[Dict] = None
+    ):
+        self.design_id = design_id
+        self.code = code
+        self.metadata = metadata or {}
+        self._score_cache: Optional[float] = None
+        self._performance = performance or Performance()
+
+    @property
+    def performance(self) -> Performance:
+        return self._performance
+
+    @performance.setter
+    def performance(self, value: Performance):
+        self._performance = value
+        self._score_cache = None
+
+    def compute_score(self) -> float:
+        """Weighted score over the measured performance dimensions.
+
+        Cached until performance is reassigned; save paths and archive
+        ranking call this repeatedly for the same measurements.
+        """
+        if self._score_cache is None:
+            p = self._performance
+            wa, ws, wm, wd = _DEFAULT_WEIGHTS
+            self._score_cache = (
+                p.accuracy * wa
+                + p.speed * ws
+                + p.memory_efficiency * wm
+                + p.adaptability * wd
+            )
+        return self._score_cache
+
+
+def _run_benchmark_pair(
+    process_items,
+    items: List[Dict],
+    small_items: List[Dict],
+    runs: int = 5,
+    small_runs: int = 2,
+):
+    """Time a design over the full workload and the adaptability slice.
+
+    Both workloads run interleaved in a single fused loop: the design's
+    code objects and the workload lists stay hot across segments instead
+    of being evicted between two back-to-back benchmark loops. Designs
+    operate on lists of dicts with string keys, so a Numba/NumPy kernel
+    does not apply here.
+
+    Returns:
+        (last full-workload result, avg seconds per full run,
+         avg seconds per small run)
+    """
+    result = None
+    elapsed_full = 0.0
+    elapsed_small = 0.0
+    for i in range(runs):
+        start = time.perf_counter()
+        result = process_items(items)
+        mid = time.perf_counter()
+        elapsed_full += mid - start
+        if i < small_runs:
+            process_items(small_items)
+            elapsed_small += time.perf_counter() - mid
+    return result, elapsed_full / runs, elapsed_small / small_runs
+
+
+class MetaLearningAgent:
+    """
+    Evolves code-based memory designs through mutate/evaluate/archive.
+    """
+
+    # Designs loaded eagerly at startup; the rest stay on disk and are
+    # fetched by id on demand.
+    ARCHIVE_LIMIT = 64
+
+    def __init__(self, db_path: str = ".openclaw/meta_learning.db"):
+        """
+        Initialize meta-learning agent.
+
+        Args:
+            db_path: Path to design archive database
+        """
+        self.db_path = db_path
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._init_database()
+        self.design_archive: List[MemoryDesign] = self._load_archive()
+        # Synthetic workload is deterministic; build it once per agent
+        # instead of per evaluation. Columns are the source of truth,
+        # the dict view exists only because designs consume dicts.
+        self._test_columns = self._generate_test_columns()
+        self._test_data = self._generate_test_data()
+        # Slice for the adaptability probe, copied once instead of per
+        # evaluation.
+        self._test_data_small = self._test_data[:200]
+        # Compiled code objects keyed by design id: re-evaluating a
+        # design skips parse+compile, the dominant cost for tiny designs.
+        self._compiled_cache: Dict[str, object] = {}
+        # Extracted process_items callables keyed by design id. Ids are
+        # content-addressed, so a cached function can never go stale;
+        # re-evaluation skips exec and the namespace lookup entirely.
+        self._fn_cache: Dict[str, object] = {}
+
+    def close(self):
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def _init_database(self):
+        """Initialize the design archive table."""
+        with self._lock:
+            cursor = self._conn.cursor()
+
+            # Same tuning as PerformanceTracker: WAL for concurrent
+            # readers, NORMAL sync, bounded WAL size.
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute("PRAGMA mmap_size=268435456")
+            cursor.execute("PRAGMA cache_size=-65536")
+            cursor.execute("PRAGMA wal_autocheckpoint=1000")
+
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS designs (
+                    design_id TEXT PRIMARY KEY,
+                    code TEXT NOT NULL,
+                    score REAL DEFAULT 0.0,
+                    accuracy REAL DEFAULT 0.0,
+                    speed REAL DEFAULT 0.0,
+                    memory_efficiency REAL DEFAULT 0.0,
+                    adaptability REAL DEFAULT 0.0,
+                    created_at INTEGER NOT NULL,
+                    metadata BLOB
+                )
+            """)
+            # Archives created before the metadata column existed
+            try:
+                cursor.execute("ALTER TABLE designs ADD COLUMN metadata BLOB")
+            except sqlite3.OperationalError:
+                pass
+
+            # Serves both the top-K startup load and best-design lookups.
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_designs_score
+                ON designs(score DESC)
+            """)
+            self._conn.commit()
+
+    def _load_archive(self) -> List[MemoryDesign]:
+        """Load the top-scoring designs from the database.
+
+        Startup cost is bounded at ARCHIVE_LIMIT rows regardless of how
+        large the archive grows; anything older is reachable lazily via
+        get_design().
+        """
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute("""
+                SELECT design_id, code, accuracy, speed, memory_efficiency,
+                       adaptability, metadata
+                FROM designs
+                ORDER BY score DESC
+                LIMIT ?
+            """, (self.ARCHIVE_LIMIT,))
+            rows = cursor.fetchall()
+
+        return [
+            MemoryDesign(row[0], row[1], Performance(*row[2:6]),
+                         metadata=_loads(row[6]))
+            for row in rows
+        ]
+
+    def get_design(self, design_id: str) -> Optional[MemoryDesign]:
+        """Get a design by id, fetching from disk if not loaded."""
+        for design in self.design_archive:
+            if design.design_id == design_id:
+                return design
+
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute("""
+                SELECT design_id, code, accuracy, speed, memory_efficiency,
+                       adaptability, metadata
+                FROM designs
+                WHERE design_id = ?
+            """, (design_id,))
+            row = cursor.fetchone()
+
+        if row is None:
+            return None
+        design = MemoryDesign(row[0], row[1], Performance(*row[2:6]),
+                              metadata=_loads(row[6]))
+        self.design_archive.append(design)
+        return design
+
+    def _generate_design_id(self, code: str) -> str:
+        """Content-addressed design id.
+
+        blake2b with digest_size=6 yields the same 12 hex chars as the
+        previous sha256[:12] in roughly a third of the cycles — sha256
+        computed a full 32-byte digest only to throw most of it away.
+        """
+        return hashlib.blake2b(code.encode(), digest_size=6).hexdigest()
+
+    def _mutate_code(self, code: str) -> str:
+        """Apply a deterministic mutation to a parent design's code.
+
+        crc32 is stable across processes (hash() varies per run under
+        PYTHONHASHSEED) and hardware-accelerated; with four mutations the
+        modulo reduces to a bitmask.
+        """
+        _, old, new = _MUTATIONS[zlib.crc32(code.encode()) & 3]
+        if old in code:
+            return code.replace(old, new)
+        # Mutation target already rewritten; revert toward the seed form.
+        return code.replace(new, old) if new in code else code
+
+    def propose_new_design(
+        self,
+        base: Optional[MemoryDesign] = None
+    ) -> MemoryDesign:
+        """
+        Propose a new design by mutating a parent.
+
+        Args:
+            base: Parent design (default: best archived, else the seed)
+
+        Returns:
+            New unevaluated MemoryDesign
+        """
+        if base is None:
+            base = self.get_best_design()
+
+        parent_code = base.code if base else DEFAULT_DESIGN_CODE
+        code = self._mutate_code(parent_code)
+        metadata = {"parent": base.design_id} if base else {}
+        return MemoryDesign(self._generate_design_id(code), code,
+                            metadata=metadata)
+
+    def _generate_test_columns(self, n: int = 1000) -> Tuple:
+        """Deterministic synthetic workload in columnar (SoA) form.
+
+        Two parallel columns instead of N two-key dicts: one container
+        header per column rather than per row, and contiguous numpy
+        arrays when numpy is installed.
+        """
+        priorities = [(i * 37 % 100) / 100.0 for i in range(n)]
+        values = [(i * 17 % 50) / 10.0 for i in range(n)]
+        if NUMPY_AVAILABLE:
+            return np.asarray(priorities), np.asarray(values)
+        return priorities, values
+
+    def _generate_test_data(self) -> List[Dict]:
+        """Row-oriented view of the synthetic workload.
+
+        Designs take lists of dicts, so the dict view is materialized
+        once here from the columnar form.
+        """
+        priorities, values = self._test_columns
+        return [
+            {"priority": p, "value": v}
+            for p, v in zip(priorities, values)
+        ]
+
+    def evaluate_design(self, design: MemoryDesign) -> Performance:
+        """
+        Execute a design against synthetic data and measure performance.
+
+        Returns:
+            Performance measurements (also stored on the design)
+        """
+        process_items = self._fn_cache.get(design.design_id)
+        if process_items is None:
+            namespace: Dict = {}
+            try:
+                code_obj = self._compiled_cache.get(design.design_id)
+                if code_obj is None:
+                    code_obj = compile(
+                        design.code, f"<design {design.design_id}>", "exec"
+                    )
+                    self._compiled_cache[design.design_id] = code_obj
+                exec(code_obj, namespace)
+                process_items = namespace["process_items"]
+            except Exception:
+                design.performance = Performance()
+                return design.performance
+            self._fn_cache[design.design_id] = process_items
+
+        items = self._test_data
+        # Per-item cost on a small slice vs the full workload: designs
+        # whose cost scales linearly adapt better to changing loads. Both
+        # measurements come out of one fused benchmark pass.
+        result, elapsed, elapsed_small = _run_benchmark_pair(
+            process_items, items, self._test_data_small
+        )
+        per_item = elapsed / len(items)
+        per_item_small = elapsed_small / len(self._test_data_small)
+        ratio = per_item / per_item_small if per_item_small else 1.0
+
+        kept = result.get("kept", 0) if isinstance(result, dict) else 0
+        design.performance = Performance(
+            # Fraction of a 50-item target window retained
+            accuracy=min(kept / 50.0, 1.0),
+            # Sub-millisecond runs score near 1.0
+            speed=1.0 / (1.0 + elapsed * 1000.0),
+            # Reward designs that discard most of the input
+            memory_efficiency=1.0 - kept / len(items),
+            # Near-linear scaling between workload sizes scores ~1.0
+            adaptability=1.0 / (1.0 + abs(ratio - 1.0)),
+        )
+        return design.performance
+
+    @staticmethod
+    def _design_row(design: MemoryDesign, now: int) -> Tuple:
+        """Flatten a design into an INSERT parameter tuple."""
+        p = design.performance
+        return (
+            design.design_id, design.code, design.compute_score(),
+            p.accuracy, p.speed, p.memory_efficiency, p.adaptability,
+            now, _dumps(design.metadata),
+        )
+
+    def save_design(self, design: MemoryDesign):
+        """Persist a design and its score to the archive."""
+        with self._lock:
+            self._conn.execute(
+                _SQL_INSERT_DESIGN, self._design_row(design, int(time.time()))
+            )
+            self._conn.commit()
+
+        self.design_archive.append(design)
+
+    def save_designs_bulk(
+        self,
+        designs: List[MemoryDesign],
+        durable: bool = True
+    ):
+        """Persist many designs in a single transaction.
+
+        One executemany inside one BEGIN/COMMIT pays a single fsync for
+        the whole batch instead of one per design. With durable=False,
+        synchronous is dropped to OFF for the duration of the batch — a
+        crash can lose the batch but not corrupt the database in WAL
+        mode, a fair trade for throwaway meta-learning runs.
+
+        Args:
+            designs: Evaluated designs to persist
+            durable: Keep the per-commit fsync (default True)
+        """
+        if not designs:
+            return
+        now = int(time.time())
+        rows = [self._design_row(d, now) for d in designs]
+        with self._lock:
+            if not durable:
+                self._conn.execute("PRAGMA synchronous=OFF")
+            try:
+                self._conn.executemany(_SQL_INSERT_DESIGN, rows)
+                self._conn.commit()
+            finally:
+                if not durable:
+                    self._conn.execute("PRAGMA synchronous=NORMAL")
+
+        # Callers may have placed designs in the archive before the batch
+        # landed (the loop keeps best-so-far visible); skip those.
+        present = {d.design_id for d in self.design_archive}
+        self.design_archive.extend(
+            d for d in designs if d.design_id not in present
+        )
+
+    def get_best_design(self) -> Optional[MemoryDesign]:
+        """Highest-scoring archived design."""
+        if not self.design_archive:
+            return None
+        return max(self.design_archive, key=lambda d: d.compute_score())
+
+    def meta_learning_loop(self, iterations: int = 5) -> Optional[MemoryDesign]:
+        """
+        Run the propose → evaluate → archive loop.
+
+        Returns:
+            Best design after the loop
+        """
+        lines = []
+        evaluated: List[MemoryDesign] = []
+        for i in range(1, iterations + 1):
+            design = self.propose_new_design()
+            self.evaluate_design(design)
+            evaluated.append(design)
+            # Keep the new design visible to best-so-far selection even
+            # though persistence is deferred to the batch below.
+            self.design_archive.append(design)
+            lines.append(f"   Iteration {i}: {design.design_id} "
+                         f"score={design.compute_score():.4f}")
+
+        # One transaction for the whole loop's designs instead of a
+        # commit per iteration.
+        self.save_designs_bulk(evaluated)
+
+        # One buffered write for the whole loop instead of a stdout
+        # syscall per iteration.
+        print("\n".join(lines))
+        return self.get_best_design()
+
+
+def example_meta_learning():
+    """Example of code-based meta-learning."""
+    print("🐺📿 Meta-Learning Agent Example")
+    print("=" * 60)
+
+    agent = MetaLearningAgent()
+
+    print("\n🧬 Running meta-learning loop...")
+    best = agent.meta_learning_loop(iterations=5)
+
+    if best:
+        print(f"\n🏆 Best design: {best.design_id}")
+        print(f"   Score: {best.compute_score():.4f}")
+        for k, v in asdict(best.performance).items():
+            print(f"   {k}: {v:.4f}")
+
+    agent.close()
+    print("\n✅ Meta-learning example complete")
+
+
+if __name__ == "__main__":
+    example_meta_learning()
+
+
+__all__ = ["MetaLearningAgent", "MemoryDesign", "Performance", "DEFAULT_DESIGN_CODE"]
@@ -0,0 +1,358 @@
+"""
+Performance Tracker for ALMA deployments.
+
+Records improvement metrics against baselines, raises alerts, and renders
+a small terminal dashboard. Metric ingestion is buffered and flushed in
+batched transactions for high-frequency recording.
+"""
+
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+class PerformanceTracker:
+    """
+    Tracks performance metrics, baselines, and alerts.
+
+    record_metric buffers rows and flushes them in one transaction every
+    buffer_size rows or flush_interval seconds, so high-frequency
+    ingestion pays one commit per batch instead of one per sample.
+    """
+
+    def __init__(
+        self,
+        db_path: str = ".openclaw/performance_tracker.db",
+        buffer_size: int = 50,
+        flush_interval: float = 5.0
+    ):
+        """
+        Initialize performance tracker.
+
+        Args:
+            db_path: Path to tracker database
+            buffer_size: Buffered rows that trigger a flush
+            flush_interval: Seconds between time-based flushes
+        """
+        self.db_path = db_path
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._buffer: List[Tuple] = []
+        self._last_flush = time.monotonic()
+        self._baseline_cache: Dict[str, float] = {}
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        # One long-lived connection per tracker, guarded by a lock:
+        # per-call sqlite3.connect() pays file open, header parse, and
+        # pragma setup on every metric.
+        self._lock = threading.Lock()
+        self._init_database()
+
+    def close(self):
+        """Flush pending metrics and close the connection."""
+        self.flush()
+        self._conn.close()
+
+    def _init_database(self):
+        """Open the persistent connection and populate the baseline cache."""
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        cursor = self._conn.cursor()
+
+        # WAL lets dashboard reads proceed concurrent with metric writes;
+        # synchronous=NORMAL drops the per-commit fsync FULL pays. The
+        # autocheckpoint bounds WAL growth under sustained ingestion.
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.execute("PRAGMA cache_size=-65536")
+        cursor.execute("PRAGMA wal_autocheckpoint=1000")
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS metrics (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                metric_category TEXT NOT NULL,
+                metric_name TEXT NOT NULL,
+                value REAL NOT NULL,
+                timestamp INTEGER NOT NULL
+            )
+        """)
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS alerts (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                alert_type TEXT NOT NULL,
+                message TEXT NOT NULL,
+                severity TEXT DEFAULT 'warning',
+                resolved INTEGER DEFAULT 0,
+                timestamp INTEGER NOT NULL
+            )
+        """)
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS baselines (
+                metric_name TEXT PRIMARY KEY,
+                baseline_value REAL NOT NULL,
+                updated_at INTEGER NOT NULL
+            )
+        """)
+
+        # get_improvement_summary filters on timestamp then groups by
+        # name; get_unresolved_alerts filters resolved=0 ordered by time.
+        # Both become index-range scans instead of full table scans.
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_metrics_time_cat_name
+            ON metrics(timestamp, metric_category, metric_name)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_alerts_unresolved
+            ON alerts(resolved, timestamp DESC)
+        """)
+
+        self._conn.commit()
+
+        # Baselines are small and read on every comparison; load them once
+        # instead of a SELECT per recorded metric.
+        cursor.execute("SELECT metric_name, baseline_value FROM baselines")
+        self._baseline_cache = dict(cursor.fetchall())
+
+    def set_baseline(self, metric_name: str, value: float):
+        """Set (or update) the baseline for a metric."""
+        with self._lock:
+            self._conn.execute("""
+                INSERT OR REPLACE INTO baselines (metric_name, baseline_value, updated_at)
+                VALUES (?, ?, ?)
+            """, (metric_name, value, int(time.time())))
+            self._conn.commit()
+        self._baseline_cache[metric_name] = value
+
+    def get_baseline(self, metric_name: str) -> Optional[float]:
+        """Get the cached baseline for a metric."""
+        return self._baseline_cache.get(metric_name)
+
+    def record_metric(
+        self,
+        metric_category: str,
+        metric_name: str,
+        value: float
+    ):
+        """
+        Record a metric sample (buffered).
+
+        Rows accumulate in memory and flush as one transaction when the
+        buffer fills or flush_interval elapses. Call flush() to force
+        pending rows out (e.g. at shutdown).
+        """
+        self._buffer.append(
+            (metric_category, metric_name, value, int(time.time()))
+        )
+
+        now = time.monotonic()
+        if (len(self._buffer) >= self.buffer_size
+                or now - self._last_flush >= self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        """Flush buffered metrics in a single transaction."""
+        if not self._buffer:
+            return
+        rows, self._buffer = self._buffer, []
+        self.record_metrics_bulk(rows)
+
+    def record_metrics_bulk(self, rows: List[Tuple]):
+        """
+        Insert many (category, name, value, timestamp) rows at once.
+
+        One executemany inside a single BEGIN/COMMIT collapses N fsyncs
+        into one on the write path.
+        """
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany("""
+                INSERT INTO metrics (metric_category, metric_name, value, timestamp)
+                VALUES (?, ?, ?, ?)
+            """, rows)
+            self._conn.commit()
+        self._last_flush = time.monotonic()
+
+    def trigger_alert(
+        self,
+        alert_type: str,
+        message: str,
+        severity: str = "warning"
+    ):
+        """Record an alert."""
+        with self._lock:
+            self._conn.execute("""
+                INSERT INTO alerts (alert_type, message, severity, timestamp)
+                VALUES (?, ?, ?, ?)
+            """, (alert_type, message, severity, int(time.time())))
+            self._conn.commit()
+
+    def check_against_baseline(
+        self,
+        metric_name: str,
+        value: float,
+        alert_threshold: float = 0.10
+    ) -> bool:
+        """
+        Compare a value to its baseline and alert on degradation.
+
+        Returns:
+            True if the value degraded past the threshold
+        """
+        baseline = self._baseline_cache.get(metric_name)
+        if baseline is None or not baseline:
+            return False
+
+        drop = (baseline - value) / baseline
+        if drop > alert_threshold:
+            self.trigger_alert(
+                "degradation",
+                f"{metric_name} dropped {drop * 100:.1f}% below baseline "
+                f"({value:.4f} vs {baseline:.4f})",
+                severity="critical",
+            )
+            return True
+        return False
+
+    def get_unresolved_alerts(self) -> List[Dict]:
+        """Get all unresolved alerts, newest first."""
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute("""
+                SELECT id, alert_type, message, severity, timestamp
+                FROM alerts
+                WHERE resolved = 0
+                ORDER BY timestamp DESC
+            """)
+            rows = cursor.fetchall()
+        alerts = [
+            {
+                "id": row[0],
+                "alert_type": row[1],
+                "message": row[2],
+                "severity": row[3],
+                "timestamp": row[4],
+            }
+            for row in rows
+        ]
+        return alerts
+
+    def resolve_alert(self, alert_id: int) -> bool:
+        """Mark an alert as resolved."""
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute("""
+                UPDATE alerts SET resolved = 1 WHERE id = ?
+            """, (alert_id,))
+            changed = cursor.rowcount > 0
+            self._conn.commit()
+        return changed
+
+    def get_improvement_summary(self, hours: int = 24) -> Dict:
+        """
+        Summarize recent metrics against baselines.
+
+        Args:
+            hours: Lookback window
+
+        Returns:
+            Dictionary keyed by category, then metric name, with avg,
+            baseline, delta
+        """
+        self.flush()
+
+        summary: Dict[str, Dict] = defaultdict(dict)
+        baselines = self._baseline_cache
+
+        with self._lock:
+            cursor = self._conn.cursor()
+            # Bound parameter instead of string interpolation: repeated
+            # dashboard refreshes reuse the compiled plan, and hours can
+            # never leak into the SQL text.
+            cutoff = int(time.time()) - hours * 3600
+            cursor.execute("""
+                SELECT metric_category, metric_name, AVG(value), COUNT(*)
+                FROM metrics
+                WHERE timestamp > ?
+                GROUP BY metric_category, metric_name
+            """, (cutoff,))
+            # Iterate the cursor directly — no fetchall() materializing a
+            # throwaway list — and let defaultdict kill the key-presence
+            # branch per row.
+            for category, name, avg, count in cursor:
+                baseline = baselines.get(name)
+                entry = {"avg": avg, "samples": count, "baseline": baseline}
+                if baseline:
+                    entry["delta_pct"] = round(
+                        (avg - baseline) / baseline * 100, 2
+                    )
+                summary[category][name] = entry
+
+        return dict(summary)
+
+    def print_dashboard(self, hours: int = 24):
+        """Print a small terminal dashboard.
+
+        Output is assembled in a list and emitted with one print: a
+        render is one stdout syscall instead of one per row, which adds
+        up under line-buffered log capture.
+        """
+        lines = ["📊 Performance Dashboard", "=" * 60]
+
+        summary = self.get_improvement_summary(hours)
+        if not summary:
+            lines.append("   (no metrics recorded)")
+        for category, metrics in summary.items():
+            lines.append(f"   [{category}]")
+            for name, entry in metrics.items():
+                line = f"     {name}: avg={entry['avg']:.4f} (n={entry['samples']})"
+                if entry.get("baseline") is not None:
+                    line += f" baseline={entry['baseline']:.4f}"
+                if "delta_pct" in entry:
+                    line += f" Δ{entry['delta_pct']:+.2f}%"
+                lines.append(line)
+
+        alerts = self.get_unresolved_alerts()
+        lines.append(f"\n🚨 Unresolved alerts: {len(alerts)}")
+        for alert in alerts[:5]:
+            lines.append(f"   [{alert['severity']}] {alert['message']}")
+
+        print("\n".join(lines))
+
+
+def example_performance_tracker():
+    """Example of performance tracking with alerts."""
+    print("🐺📿 Performance Tracker Example")
+    print("=" * 60)
+
+    tracker = PerformanceTracker()
+
+    print("\n📏 Setting baselines...")
+    tracker.set_baseline("memory_accuracy", 0.90)
+    tracker.set_baseline("compression_ratio", 0.75)
+
+    print("\n📊 Recording metrics...")
+    for i in range(10):
+        tracker.record_metric("memory", "memory_accuracy", 0.91 + i * 0.002)
+        tracker.record_metric("memory", "compression_ratio", 0.74)
+    tracker.flush()
+
+    print("\n🛡️ Checking against baseline...")
+    degraded = tracker.check_against_baseline("memory_accuracy", 0.70)
+    print(f"   Degraded: {degraded}")
+
+    print()
+    tracker.print_dashboard()
+
+    print("\n✅ Performance tracker example complete")
+
+
+if __name__ == "__main__":
+    example_performance_tracker()
+
+
+__all__ = ["PerformanceTracker"]
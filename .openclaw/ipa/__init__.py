@@ -1,4 +1,19 @@
 from .ipa_evaluator import IPAEvaluator, InteractionChunk
+from .interaction_chunker import (
+    InteractionChunker,
+    MessageChunk,
+    ThreadEvaluator,
+    ChunkEvaluationResult,
+)
 from .paom_ipa_integration import PAOM_IPA_Integrator, PAOM_IPA_CLI
 
-__all__ = ["IPAEvaluator", "InteractionChunk", "PAOM_IPA_Integrator", "PAOM_IPA_CLI"]
+__all__ = [
+    "IPAEvaluator",
+    "InteractionChunk",
+    "InteractionChunker",
+    "MessageChunk",
+    "ThreadEvaluator",
+    "ChunkEvaluationResult",
+    "PAOM_IPA_Integrator",
+    "PAOM_IPA_CLI",
+]
@@ -8,6 +8,7 @@ with emoji prioritization and multi-date temporal tracking.
 Inspired by Mastra: https://mastra.ai/blog/observational-memory
 """
 
+import re
 import sqlite3
 from pathlib import Path
 from datetime import datetime
@@ -18,7 +19,10 @@ from .types import (
     Observation,
     ObservationalMemoryRecord,
     PriorityLevel,
+    default_config,
 )
+from .compressed_log import CompressedObservationLog
+from .prompt_cache import PromptModuleRegistry
 from typing import Dict, List, Optional, Tuple
 import json
 
@@ -50,13 +54,23 @@ class ObservationalMemory:
 
     def __init__(self, config: Optional[ObservationConfig] = None):
         """Initialize Observational Memory system."""
-        from .types import default_config
-
         self.config = config or default_config()
         self.token_counter = get_token_counter(self.config)
         self.observer = ObserverAgent(self.config)
         self.reflector = ReflectorAgent(self.config)
 
+        # Memoized _format_observations output per thread:
+        # thread_id -> ((observation count, total repeats), formatted)
+        self._fmt_cache: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
+        # Loaded records, so process-then-get_context style call chains
+        # hit storage once per thread instead of once per call
+        self._record_cache: Dict[str, ObservationalMemoryRecord] = {}
+
+        # Prompt modules: the observation block per thread, versioned by
+        # reflection generation so actors can reference it by id
+        self.prompt_modules = PromptModuleRegistry()
+
         # Initialize SQLite storage
         self._init_database()
 
@@ -77,10 +91,20 @@ class ObservationalMemory:
                 priority TEXT NOT NULL,
                 content TEXT NOT NULL,
                 referenced_date TEXT,
+                repeat_count INTEGER DEFAULT 1,
                 created_at TEXT DEFAULT CURRENT_TIMESTAMP
             )
         """)
 
+        # Migrate databases created before duplicate folding
+        try:
+            cursor.execute("""
+                ALTER TABLE observations ADD COLUMN repeat_count INTEGER DEFAULT 1
+            """)
+        except sqlite3.OperationalError:
+            # Column already exists
+            pass
+
         # Create memory_records table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS memory_records (
@@ -89,20 +113,74 @@ class ObservationalMemory:
                 current_task TEXT,
                 suggested_response TEXT,
                 last_observed_at TEXT,
+                reflected_count INTEGER DEFAULT 0,
                 updated_at TEXT DEFAULT CURRENT_TIMESTAMP
             )
         """)
 
+        # Migrate databases created before the reflection watermark
+        try:
+            cursor.execute("""
+                ALTER TABLE memory_records ADD COLUMN reflected_count INTEGER DEFAULT 0
+            """)
+        except sqlite3.OperationalError:
+            # Column already exists
+            pass
+
         # Create index on thread_id
         cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_thread_id ON observations(thread_id)
         """)
 
+        # Keyword index over observation content for reflection
+        # candidate selection; optional — builds without it
+        self._fts_available = True
+        try:
+            cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS obs_fts
+                USING fts5(thread_id UNINDEXED, content, tokenize='trigram')
+            """)
+        except sqlite3.OperationalError:
+            try:
+                # Older SQLite without the trigram tokenizer
+                cursor.execute("""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS obs_fts
+                    USING fts5(thread_id UNINDEXED, content)
+                """)
+            except sqlite3.OperationalError:
+                # FTS5 unavailable; reflection falls back to full input
+                self._fts_available = False
+
         conn.commit()
         conn.close()
 
+    @staticmethod
+    def _build_record(record_data, obs_data) -> ObservationalMemoryRecord:
+        """Build a record from memory_records and observations rows."""
+        observations = []
+        for row in obs_data:
+            observations.append(Observation(
+                timestamp=datetime.fromisoformat(row[0]),
+                priority=row[1],
+                content=row[2],
+                referenced_date=datetime.fromisoformat(row[3]) if row[3] else None,
+                repeat_count=row[4] or 1,
+            ))
+
+        return ObservationalMemoryRecord(
+            observations=observations,
+            current_task=record_data[0] or "",
+            suggested_response=record_data[1] or "",
+            last_observed_at=datetime.fromisoformat(record_data[2]) if record_data[2] else None,
+            reflected_count=record_data[3] or 0,
+        )
+
     def get_observation_record(self, thread_id: str) -> Optional[ObservationalMemoryRecord]:
-        """Get memory record for a thread from SQLite database."""
+        """Get memory record for a thread, loading from SQLite on miss."""
+        cached = self._record_cache.get(thread_id)
+        if cached is not None:
+            return cached
+
         db_path = Path(self.config.db_path)
         if not db_path.exists():
             return None
@@ -112,7 +190,7 @@ class ObservationalMemory:
 
         # Get memory record
         cursor.execute("""
-            SELECT current_task, suggested_response, last_observed_at
+            SELECT current_task, suggested_response, last_observed_at, reflected_count
             FROM memory_records
             WHERE thread_id = ?
         """, (thread_id,))
@@ -124,7 +202,7 @@ class ObservationalMemory:
 
         # Get observations
         cursor.execute("""
-            SELECT timestamp, priority, content, referenced_date
+            SELECT timestamp, priority, content, referenced_date, repeat_count
             FROM observations
             WHERE thread_id = ?
             ORDER BY created_at ASC
@@ -133,26 +211,60 @@ class ObservationalMemory:
 
         conn.close()
 
-        # Build observations list
-        observations = []
-        for row in obs_data:
-            obs = Observation(
-                timestamp=datetime.fromisoformat(row[0]),
-                priority=row[1],
-                content=row[2],
-                referenced_date=datetime.fromisoformat(row[3]) if row[3] else None
-            )
-            observations.append(obs)
+        record = self._build_record(record_data, obs_data)
+        self._record_cache[thread_id] = record
+        return record
 
-        return ObservationalMemoryRecord(
-            observations=observations,
-            current_task=record_data[0] or "",
-            suggested_response=record_data[1] or "",
-            last_observed_at=datetime.fromisoformat(record_data[2]) if record_data[2] else None
-        )
+    def preload_threads(self, thread_ids: List[str]) -> None:
+        """Batch-load records for several threads into the cache.
+
+        One pair of IN (...) queries replaces a round trip per thread;
+        subsequent get_observation_record / get_context / get_stats
+        calls for these threads are served from the cache.
+        """
+        missing = [t for t in thread_ids if t not in self._record_cache]
+        if not missing:
+            return
+
+        db_path = Path(self.config.db_path)
+        if not db_path.exists():
+            return
+
+        placeholders = ",".join("?" * len(missing))
+        conn = sqlite3.connect(db_path)
+        cursor = conn.cursor()
+
+        cursor.execute(f"""
+            SELECT thread_id, current_task, suggested_response, last_observed_at, reflected_count
+            FROM memory_records
+            WHERE thread_id IN ({placeholders})
+        """, missing)
+        records_by_thread = {row[0]: row[1:] for row in cursor.fetchall()}
+
+        cursor.execute(f"""
+            SELECT thread_id, timestamp, priority, content, referenced_date, repeat_count
+            FROM observations
+            WHERE thread_id IN ({placeholders})
+            ORDER BY created_at ASC
+        """, missing)
+        obs_by_thread: Dict[str, list] = {}
+        for row in cursor.fetchall():
+            obs_by_thread.setdefault(row[0], []).append(row[1:])
+
+        conn.close()
+
+        for thread_id, record_data in records_by_thread.items():
+            self._record_cache[thread_id] = self._build_record(
+                record_data, obs_by_thread.get(thread_id, [])
+            )
 
     def _save_observation_record(self, thread_id: str, record: ObservationalMemoryRecord):
         """Save memory record to SQLite database."""
+        # Observations changed; drop the memoized formatting and the
+        # cached record for this thread
+        self._fmt_cache.pop(thread_id, None)
+        self._record_cache.pop(thread_id, None)
+
         db_path = Path(self.config.db_path)
         conn = sqlite3.connect(db_path)
         cursor = conn.cursor()
@@ -160,13 +272,14 @@ class ObservationalMemory:
         # Update memory record
         cursor.execute("""
             INSERT OR REPLACE INTO memory_records
-            (thread_id, current_task, suggested_response, last_observed_at, updated_at)
-            VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+            (thread_id, current_task, suggested_response, last_observed_at, reflected_count, updated_at)
+            VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
         """, (
             thread_id,
             record.current_task,
             record.suggested_response,
-            record.last_observed_at.isoformat() if record.last_observed_at else None
+            record.last_observed_at.isoformat() if record.last_observed_at else None,
+            record.reflected_count,
         ))
 
         # Clear old observations for this thread (they're being replaced)
@@ -174,23 +287,98 @@ class ObservationalMemory:
             DELETE FROM observations WHERE thread_id = ?
         """, (thread_id,))
 
-        # Insert observations
-        for obs in record.observations:
-            cursor.execute("""
-                INSERT INTO observations
-                (thread_id, timestamp, priority, content, referenced_date)
-                VALUES (?, ?, ?, ?, ?)
-            """, (
+        # Insert observations as one batch statement; together with the
+        # update and delete above this ships the whole save in a single
+        # transaction/commit instead of a round trip per row
+        cursor.executemany("""
+            INSERT INTO observations
+            (thread_id, timestamp, priority, content, referenced_date, repeat_count)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, [
+            (
                 thread_id,
                 obs.timestamp.isoformat(),
                 obs.priority,
                 obs.content,
-                obs.referenced_date.isoformat() if obs.referenced_date else None
-            ))
+                obs.referenced_date.isoformat() if obs.referenced_date else None,
+                obs.repeat_count,
+            )
+            for obs in record.observations
+        ])
+
+        # Mirror contents into the keyword index
+        if self._fts_available:
+            cursor.execute("DELETE FROM obs_fts WHERE thread_id = ?", (thread_id,))
+            cursor.executemany(
+                "INSERT INTO obs_fts (thread_id, content) VALUES (?, ?)",
+                [(thread_id, obs.content) for obs in record.observations],
+            )
 
         conn.commit()
         conn.close()
 
+    # Reflection candidate selection: cap on keyword-relevant
+    # observations sent to the reflector, and how many of the newest
+    # pending observations are always kept
+    REFLECTION_CANDIDATES_K = 200
+    REFLECTION_KEEP_RECENT = 20
+
+    def _select_reflection_candidates(
+        self,
+        thread_id: str,
+        pending: List[Observation],
+    ) -> Tuple[List[Observation], Optional[Observation]]:
+        """Pick keyword-relevant observations to feed the reflector.
+
+        Uses the obs_fts index with the latest observation as the query
+        and BM25 ranking; low-relevance observations are folded into a
+        single digest observation. Returns (candidates, digest). Falls
+        back to the full pending list when FTS5 is unavailable or the
+        list is already small.
+        """
+        if not self._fts_available or len(pending) <= self.REFLECTION_CANDIDATES_K:
+            return pending, None
+
+        words = re.findall(r"\w+", pending[-1].content)[:16]
+        if not words:
+            return pending, None
+        query = " OR ".join(f'"{w}"' for w in words)
+
+        conn = sqlite3.connect(Path(self.config.db_path))
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT content FROM obs_fts
+                WHERE thread_id = ? AND obs_fts MATCH ?
+                ORDER BY bm25(obs_fts)
+                LIMIT ?
+            """, (thread_id, query, self.REFLECTION_CANDIDATES_K))
+            top_contents = {row[0] for row in cursor.fetchall()}
+        except sqlite3.OperationalError:
+            return pending, None
+        finally:
+            conn.close()
+
+        # Keep ranked observations plus the newest ones (which may not
+        # be indexed yet), preserving chronological order
+        cutoff = len(pending) - self.REFLECTION_KEEP_RECENT
+        candidates = [
+            obs for i, obs in enumerate(pending)
+            if i >= cutoff or obs.content in top_contents
+        ]
+        dropped = len(pending) - len(candidates)
+        if dropped == 0:
+            return pending, None
+
+        # YELLOW so the no-LLM condensation fallback (which drops GREEN)
+        # keeps the trace of what was trimmed
+        digest = Observation(
+            timestamp=pending[0].timestamp,
+            priority=PriorityLevel.YELLOW,
+            content=f"Digest: {dropped} earlier low-relevance observations condensed",
+        )
+        return candidates, digest
+
     def process_messages(
         self,
         thread_id: str,
@@ -213,7 +401,7 @@ class ObservationalMemory:
             record = ObservationalMemoryRecord(observations=[])
 
         # Get existing observations as text
-        existing_obs_text = self._format_observations(record.observations)
+        existing_obs_text = self._format_observations(record.observations, thread_id)
 
         # Extract new observations
         new_observations, current_task, suggested = self.observer.extract_observations(
@@ -221,17 +409,26 @@ class ObservationalMemory:
             existing_obs_text
         )
 
-        # Combine observations
-        combined = record.observations + new_observations
-
-        # Check if reflection needed
-        observation_count = self.token_counter.count_observations(combined)
-        if observation_count > self.config.reflection_threshold:
-            # Trigger Reflector
-            combined = self.reflector.reflect(combined)
+        # Append new observations to the pending tail, folding repeats
+        # of an existing (priority, content) pair into repeat_count
+        record.fold_in(new_observations)
+
+        # Reflect only the pending tail beyond the watermark; the
+        # already-reflected prefix stays untouched so each reflect call
+        # is bounded by the delta, not the full history.
+        pending = record.pending
+        pending_tokens = self.token_counter.count_observations(pending)
+        if pending_tokens > self.config.reflection_threshold:
+            candidates, digest = self._select_reflection_candidates(thread_id, pending)
+            if digest is not None:
+                candidates = [digest] + candidates
+            reflected_tail = self.reflector.reflect(candidates)
+            record.observations = record.reflected_prefix + reflected_tail
+            record.reflected_count = len(record.observations)
+            record._seen = None  # observation list was rebuilt
+            self.prompt_modules.bump_generation(thread_id)
 
         # Update record
-        record.observations = combined
         record.current_task = current_task or record.current_task
         record.suggested_response = suggested or record.suggested_response
         record.last_observed_at = datetime.now()
@@ -241,12 +438,21 @@ class ObservationalMemory:
 
         return record
 
+    # Verbatim separator between sections so the tokenized prefix stays
+    # identical across calls (prefix-cache friendly).
+    SECTION_SEPARATOR = "\n\n"
+
     def get_context(self, thread_id: str) -> str:
         """
         Get formatted context for actor (main agent).
 
+        Static content first, dynamic content last: observations change
+        only on threshold trips while current_task/suggested_response
+        change every turn, so this ordering preserves the prompt prefix
+        for downstream LLM caching.
+
         Returns:
-        - Observations (compressed history)
+        - Observations (compressed history, oldest dates first)
         - Current task (if available)
         - Suggested response (if available)
         """
@@ -254,66 +460,110 @@ class ObservationalMemory:
         if record is None:
             return "No observations yet."
 
-        # Format for actor
-        context = self._format_observations(record.observations)
-
-        # Add suggested response
-        if record.suggested_response:
-            context += f"\n\n<Suggested Response>\n{record.suggested_response}\n"
+        # Most-static block first: observations, oldest dates first.
+        # The block is also registered as a prompt module so actors can
+        # reference it by id instead of re-sending the text each turn.
+        formatted = self._format_observations(record.observations, thread_id)
+        self.prompt_modules.register_module(
+            self.prompt_modules.module_id(thread_id), formatted
+        )
+        sections = [f"<Observations>\n{formatted}\n</Observations>"]
 
-        # Add current task
+        # Dynamic blocks last (change every turn)
         if record.current_task:
-            context += f"\n\n<Current Task>\n{record.current_task}\n"
+            sections.append(f"<Current Task>\n{record.current_task}\n</Current Task>")
+        if record.suggested_response:
+            sections.append(
+                f"<Suggested Response>\n{record.suggested_response}\n</Suggested Response>"
+            )
 
-        return context
+        return self.SECTION_SEPARATOR.join(sections)
 
-    def _format_observations(self, observations: List[Observation]) -> str:
-        """Format observations for context."""
+    def _format_observations(
+        self,
+        observations: List[Observation],
+        thread_id: Optional[str] = None,
+    ) -> str:
+        """Format observations for context.
+
+        When a thread_id is given the formatted string is memoized and
+        reused while the observation list is unchanged; the key covers
+        the list length and the total repeat count (fold_in bumps
+        repeat_count without changing the length), and writes through
+        _save_observation_record invalidate the entry.
+        """
         if not observations:
             return ""
 
-        # Group by date
-        grouped: Dict[str, List[Observation]] = {}
-        for obs in observations:
-            date_key = obs.timestamp.date().isoformat()
-            if date_key not in grouped:
-                grouped[date_key] = []
-            grouped[date_key].append(obs)
+        state = None
+        if thread_id is not None:
+            state = (
+                len(observations),
+                sum(obs.repeat_count for obs in observations),
+            )
+            cached = self._fmt_cache.get(thread_id)
+            if cached is not None and cached[0] == state:
+                return cached[1]
+
+        # Single pass over time-sorted observations, emitting a date
+        # header whenever the date changes (no dict grouping needed)
+        obs_sorted = sorted(observations, key=lambda o: o.timestamp)
 
-        # Format output
         lines = []
-        for date_key in sorted(grouped.keys()):
-            lines.append(f"Date: {date_key}")
-            for obs in grouped[date_key]:
-                time_str = obs.timestamp.strftime("%H:%M")
-                emoji = obs.priority  # Now a string: "🔴", "🟡", "🟢"
-                lines.append(f"* {emoji} ({time_str}) {obs.content}")
-
-        return "\n".join(lines)
+        prev_date = None
+        for obs in obs_sorted:
+            # Date key and line are precomputed on the Observation
+            if obs._date_key != prev_date:
+                lines.append(f"Date: {obs._date_key}")
+                prev_date = obs._date_key
+            if obs.repeat_count > 1:
+                lines.append(f"{obs._line_suffix} (x{obs.repeat_count})")
+            else:
+                lines.append(obs._line_suffix)
+
+        formatted = "\n".join(lines)
+        if thread_id is not None:
+            self._fmt_cache[thread_id] = (state, formatted)
+        return formatted
 
     def get_stats(self, thread_id: str) -> Dict:
         """Get statistics about observational memory."""
+        cache_stats = {
+            "observer_cache": dict(self.observer._cache_stats),
+            "reflector_cache": dict(self.reflector._cache_stats),
+        }
+
         record = self.get_observation_record(thread_id)
         if record is None:
-            return {"total_observations": 0}
+            return {"total_observations": 0, **cache_stats}
 
         return {
             "total_observations": len(record.observations),
             "last_observed_at": None,
             "has_current_task": bool(record.current_task),
+            **cache_stats,
         }
 
+    def get_stats_bulk(self, thread_ids: List[str]) -> Dict[str, Dict]:
+        """Get statistics for several threads with one batched fetch."""
+        self.preload_threads(thread_ids)
+        return {thread_id: self.get_stats(thread_id) for thread_id in thread_ids}
+
     def force_reflection(self, thread_id: str) -> str:
-        """Force reflection on a thread."""
+        """Force reflection on a thread and persist the result."""
         record = self.get_observation_record(thread_id)
-        if record is None:
+        if record is None or not record.observations:
             return "No observations to reflect."
 
-        # Trigger Reflector
-        reflected = self.reflector.reflect(record.observations)
+        # Trigger Reflector; slice-assign so external references to the
+        # list see the condensed result
+        record.observations[:] = self.reflector.reflect(record.observations)
+        record.reflected_count = len(record.observations)
+        record._seen = None  # observation list was rebuilt
+        self.prompt_modules.bump_generation(thread_id)
 
-        # Update record
-        record.observations = reflected
+        # Persist so the reflection survives the next load
+        self._save_observation_record(thread_id, record)
         return f"✅ Reflection complete. {len(record.observations)} observations"
 
 
@@ -324,4 +574,6 @@ __all__ = [
     "Observation",
     "ObservationalMemoryRecord",
     "PriorityLevel",
+    "CompressedObservationLog",
+    "PromptModuleRegistry",
 ]
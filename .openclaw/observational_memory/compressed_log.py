@@ -0,0 +1,131 @@
+"""
+Compressed columnar storage for observations.
+
+Long-lived threads can accumulate tens of thousands of observations,
+where per-object Python overhead dominates memory. This module stores
+observations struct-of-arrays style: one u32 array of second offsets
+from the first timestamp, one byte per priority, and a list of
+(interned) content strings. Observations are decoded lazily, and the
+formatted context lines can be produced without materializing
+Observation objects at all.
+
+Opt-in: callers that only ever format or iterate can hold a
+CompressedObservationLog instead of a List[Observation].
+"""
+
+import sys
+from array import array
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from .types import Observation, PriorityLevel
+
+# 1-byte priority discriminators
+_PRIORITY_TO_BYTE = {
+    PriorityLevel.GREEN: 0,
+    PriorityLevel.YELLOW: 1,
+    PriorityLevel.RED: 2,
+}
+_BYTE_TO_PRIORITY = (PriorityLevel.GREEN, PriorityLevel.YELLOW, PriorityLevel.RED)
+
+
+class CompressedObservationLog:
+    """Columnar, append-only observation store.
+
+    Timestamps are stored as u32 second offsets from the first
+    observation (fixed width, so random access stays O(1) without a
+    skip index). Priorities take one byte each. Content strings are
+    interned so repeated observations share storage.
+    """
+
+    def __init__(self, observations: Optional[Iterable[Observation]] = None):
+        self.first_ts: Optional[datetime] = None
+        self.ts_deltas: array = array("I")  # seconds since first_ts
+        self.priorities: bytearray = bytearray()
+        self.contents: List[str] = []
+        self.tok_lens: array = array("I")  # per-entry token counts, 0 = uncounted
+        # referenced_date is rare; keep it sparse
+        self._referenced_dates: Dict[int, datetime] = {}
+
+        if observations is not None:
+            self.extend(observations)
+
+    def append(self, obs: Observation) -> None:
+        """Append one observation to the log."""
+        if self.first_ts is None:
+            self.first_ts = obs.timestamp
+        delta = int((obs.timestamp - self.first_ts).total_seconds())
+        self.ts_deltas.append(max(delta, 0))
+        self.priorities.append(_PRIORITY_TO_BYTE.get(obs.priority, 1))
+        self.contents.append(sys.intern(obs.content))
+        self.tok_lens.append(obs._tok_len or 0)
+        if obs.referenced_date is not None:
+            self._referenced_dates[len(self.contents) - 1] = obs.referenced_date
+
+    def extend(self, observations: Iterable[Observation]) -> None:
+        """Append many observations to the log."""
+        for obs in observations:
+            self.append(obs)
+
+    def __len__(self) -> int:
+        return len(self.contents)
+
+    def _timestamp_at(self, index: int) -> datetime:
+        return self.first_ts + timedelta(seconds=self.ts_deltas[index])
+
+    def __getitem__(self, index: int) -> Observation:
+        """Materialize a single observation on demand."""
+        if index < 0:
+            index += len(self.contents)
+        return Observation(
+            timestamp=self._timestamp_at(index),
+            priority=_BYTE_TO_PRIORITY[self.priorities[index]],
+            content=self.contents[index],
+            referenced_date=self._referenced_dates.get(index),
+            _tok_len=self.tok_lens[index] or None,
+        )
+
+    def __iter__(self) -> Iterator[Observation]:
+        for i in range(len(self.contents)):
+            yield self[i]
+
+    def iter_formatted_lines(self) -> Iterator[str]:
+        """Yield context lines (with Date: headers) straight from the
+        columns, without building Observation objects.
+
+        Line format matches ObservationalMemory._format_observations.
+        """
+        prev_date = None
+        for i in range(len(self.contents)):
+            ts = self._timestamp_at(i)
+            date_key = ts.date().isoformat()
+            if date_key != prev_date:
+                yield f"Date: {date_key}"
+                prev_date = date_key
+            emoji = _BYTE_TO_PRIORITY[self.priorities[i]]
+            yield f"* {emoji} ({ts.strftime('%H:%M')}) {self.contents[i]}"
+
+    def format(self) -> str:
+        """Return the full formatted context block."""
+        return "\n".join(self.iter_formatted_lines())
+
+    def token_count(self, counter) -> int:
+        """Total token count across the log, using the columnar cache.
+
+        Uncounted entries (tok_lens == 0) are measured once with the
+        given counter's count_tokens/count_text; after that the whole
+        check is a C-level sum over a u32 array instead of a Python
+        loop over objects.
+        """
+        count_text = getattr(counter, "count_tokens", None) or counter.count_text
+        for i, cached in enumerate(self.tok_lens):
+            if cached == 0:
+                self.tok_lens[i] = count_text(self.contents[i])
+        return sum(self.tok_lens)
+
+    def to_observations(self) -> List[Observation]:
+        """Materialize the whole log as Observation objects."""
+        return list(self)
+
+
+__all__ = ["CompressedObservationLog"]
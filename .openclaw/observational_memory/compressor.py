@@ -0,0 +1,109 @@
+"""
+Rule-based text compression for observations.
+
+Long messages (logs, tracebacks, JSON dumps) bloat observation storage
+and reflection cost. This module applies cheap, deterministic rules —
+whitespace collapsing, ANSI-escape stripping, URL truncation,
+repeated-line folding, and JSON structure summarization — before
+content reaches the LLM, typically cutting tokens by half or more with
+no model involved.
+"""
+
+import hashlib
+import json
+import re
+from typing import List
+
+# ANSI escape sequences (colors, cursor movement)
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+
+# URLs; kept down to scheme + hostname
+_URL_RE = re.compile(r"(https?://[^/\s]+)\S*")
+
+# Runs of spaces/tabs (newlines handled separately for line folding)
+_WS_RE = re.compile(r"[ \t]+")
+
+
+def raw_hash(text: str) -> bytes:
+    """Short stable hash of the original text, kept for provenance."""
+    return hashlib.blake2b(text.encode("utf-8", "replace"), digest_size=8).digest()
+
+
+def _summarize_json(value, depth: int = 0) -> str:
+    """Summarize a parsed JSON value as keys + value types."""
+    if isinstance(value, dict):
+        if depth >= 2:
+            return f"{{...{len(value)} keys}}"
+        parts = [f"{k}: {_summarize_json(v, depth + 1)}" for k, v in value.items()]
+        return "{" + ", ".join(parts) + "}"
+    if isinstance(value, list):
+        if not value:
+            return "[]"
+        return f"[{len(value)}x {_summarize_json(value[0], depth + 1)}]"
+    return type(value).__name__
+
+
+def _fold_repeated_lines(lines: List[str]) -> List[str]:
+    """Fold consecutive identical lines into one with a repeat count."""
+    folded: List[str] = []
+    count = 0
+    prev = None
+    for line in lines:
+        if line == prev:
+            count += 1
+            continue
+        if count > 1:
+            folded[-1] = f"{prev} (repeated {count}x)"
+        folded.append(line)
+        prev = line
+        count = 1
+    if count > 1:
+        folded[-1] = f"{prev} (repeated {count}x)"
+    return folded
+
+
+def compress(text: str, level: str = "medium") -> str:
+    """Compress text with rule-based filters.
+
+    Levels:
+    - "low": collapse whitespace runs, strip ANSI escapes
+    - "medium": low + truncate URLs to hostname + fold repeated lines
+    - "high": medium + replace JSON bodies with key/type summaries
+
+    Args:
+        text: Input text
+        level: Compression level ("low", "medium", "high")
+
+    Returns:
+        Compressed text
+    """
+    if not text:
+        return text
+
+    # (b) strip ANSI escapes, (a) collapse whitespace runs
+    text = _ANSI_RE.sub("", text)
+    text = _WS_RE.sub(" ", text)
+
+    if level == "low":
+        return text.strip()
+
+    # (e) JSON bodies become key/type summaries
+    if level == "high":
+        stripped = text.strip()
+        if stripped[:1] in "{[":
+            try:
+                text = _summarize_json(json.loads(stripped))
+            except (ValueError, RecursionError):
+                pass
+
+    # (c) truncate URLs to scheme + hostname
+    text = _URL_RE.sub(r"\1/...", text)
+
+    # (d) fold consecutive repeated lines
+    lines = [line.strip() for line in text.split("\n")]
+    lines = _fold_repeated_lines([line for line in lines if line])
+
+    return "\n".join(lines)
+
+
+__all__ = ["compress", "raw_hash"]
@@ -6,18 +6,34 @@ observation extraction and reflection.
 """
 
 import os
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Union
 from abc import ABC, abstractmethod
 
+# System prompts may be passed as a plain string or as a list of
+# provider-style text blocks (e.g. with cache_control markers)
+SystemPrompt = Union[str, List[Dict]]
+
+
+def _system_text(system: SystemPrompt) -> str:
+    """Flatten a system prompt to plain text for providers that take strings."""
+    if isinstance(system, str):
+        return system
+    return "\n".join(block.get("text", "") for block in system)
+
 
 class LLMClient(ABC):
     """Abstract base class for LLM clients."""
 
+    # Prompt-cache usage from the most recent generate() call, as
+    # {"created": tokens, "read": tokens}; None when the provider
+    # reports no cache usage
+    last_usage: Optional[Dict] = None
+
     @abstractmethod
     def generate(
         self,
         prompt: str,
-        system: Optional[str] = None,
+        system: Optional[SystemPrompt] = None,
         temperature: float = 0.3,
         max_tokens: int = 1000
     ) -> str:
@@ -43,7 +59,7 @@ class AnthropicClient(LLMClient):
     def generate(
         self,
         prompt: str,
-        system: Optional[str] = None,
+        system: Optional[SystemPrompt] = None,
         temperature: float = 0.3,
         max_tokens: int = 1000
     ) -> str:
@@ -55,9 +71,27 @@ class AnthropicClient(LLMClient):
             "messages": [{"role": "user", "content": prompt}],
         }
         if system:
+            # Bare strings get wrapped so the static prefix is always
+            # cache-marked; block lists pass through as-is
+            if isinstance(system, str):
+                system = [{
+                    "type": "text",
+                    "text": system,
+                    "cache_control": {"type": "ephemeral"},
+                }]
             kwargs["system"] = system
 
         response = self.client.messages.create(**kwargs)
+
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            self.last_usage = {
+                "created": getattr(usage, "cache_creation_input_tokens", 0) or 0,
+                "read": getattr(usage, "cache_read_input_tokens", 0) or 0,
+            }
+        else:
+            self.last_usage = None
+
         return response.content[0].text
 
 
@@ -79,14 +113,15 @@ class OpenAIClient(LLMClient):
     def generate(
         self,
         prompt: str,
-        system: Optional[str] = None,
+        system: Optional[SystemPrompt] = None,
         temperature: float = 0.3,
         max_tokens: int = 1000
     ) -> str:
         """Generate text using OpenAI GPT."""
         messages = []
         if system:
-            messages.append({"role": "system", "content": system})
+            # OpenAI prefix-caches automatically; flatten block lists
+            messages.append({"role": "system", "content": _system_text(system)})
         messages.append({"role": "user", "content": prompt})
 
         response = self.client.chat.completions.create(
@@ -95,6 +130,11 @@ class OpenAIClient(LLMClient):
             temperature=temperature,
             max_tokens=max_tokens,
         )
+
+        details = getattr(getattr(response, "usage", None), "prompt_tokens_details", None)
+        cached = getattr(details, "cached_tokens", 0) or 0
+        self.last_usage = {"created": 0, "read": cached} if cached else None
+
         return response.choices[0].message.content
 
 
@@ -117,14 +157,14 @@ class GoogleClient(LLMClient):
     def generate(
         self,
         prompt: str,
-        system: Optional[str] = None,
+        system: Optional[SystemPrompt] = None,
         temperature: float = 0.3,
         max_tokens: int = 1000
     ) -> str:
         """Generate text using Google Gemini."""
         full_prompt = prompt
         if system:
-            full_prompt = f"{system}\n\n{prompt}"
+            full_prompt = f"{_system_text(system)}\n\n{prompt}"
 
         response = self.client.generate_content(
             full_prompt,
@@ -5,7 +5,9 @@ Extracts observations from message history when threshold is exceeded.
 Uses LLM for intelligent observation extraction.
 """
 
+import re
 from typing import Dict, List, Optional, Tuple
+from .compressor import compress, raw_hash
 from .types import (
     Observation,
     ObservationConfig,
@@ -56,6 +58,26 @@ Priorities:
 REMEMBER: These observations are assistant's ENTIRE memory. Any detail you fail to observe is permanently forgotten. Use common sense - if something seems like it might be important to remember, it probably is. When in doubt, observe it.
 """
 
+    # Compiled once at class level; named groups map straight to the
+    # heuristic branch, and re.IGNORECASE removes the per-message
+    # content.lower() copy.
+    _HEURISTIC_RE = re.compile(
+        r"\b(?P<family>kids|children)\b"
+        r"|\b(?P<work>work|job)\b"
+        r"|\b(?P<help>help)\b",
+        re.IGNORECASE,
+    )
+
+    _HEURISTIC_OBSERVATIONS = {
+        "family": (PriorityLevel.RED, "User mentioned family (children)"),
+        "work": (PriorityLevel.YELLOW, "User discussed work situation"),
+        "help": (PriorityLevel.YELLOW, "User asked for help"),
+    }
+
+    # Precedence when several groups match, regardless of position:
+    # family (🔴) beats work beats help
+    _HEURISTIC_PRECEDENCE = ("family", "work", "help")
+
     def __init__(self, config: ObservationConfig):
         """Initialize Observer agent."""
         self.config = config
@@ -70,6 +92,42 @@ REMEMBER: These observations are assistant's ENTIRE memory. Any detail you fail
             # Fallback to simple extraction
             self.llm_client = None
 
+        # Prompt-cache token counters across provider calls
+        self._cache_stats = {"created": 0, "read": 0, "miss": 0}
+
+    def _record_cache_usage(self):
+        """Fold the last provider call's cache usage into the counters."""
+        usage = getattr(self.llm_client, "last_usage", None)
+        if not usage:
+            self._cache_stats["miss"] += 1
+            return
+        self._cache_stats["created"] += usage.get("created", 0)
+        self._cache_stats["read"] += usage.get("read", 0)
+        if not usage.get("read"):
+            self._cache_stats["miss"] += 1
+
+    def build_messages(self, dynamic_content: str) -> List[Dict]:
+        """Build provider messages with a cacheable static prefix.
+
+        The system prompt is byte-identical across calls and marked with
+        ephemeral cache_control, so Anthropic prompt caching (and OpenAI
+        automatic prefix caching) reuses it on every threshold trip;
+        only the dynamic user content is re-processed.
+        """
+        return [
+            {
+                "role": "system",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": self.SYSTEM_PROMPT,
+                        "cache_control": {"type": "ephemeral"},
+                    },
+                ],
+            },
+            {"role": "user", "content": dynamic_content},
+        ]
+
     def extract_observations(
         self,
         messages: List[Dict],
@@ -114,13 +172,17 @@ Each observation on its own line.
 
 Output ONLY observations, nothing else."""
 
+        # Cacheable system block + dynamic user content
+        provider_messages = self.build_messages(prompt)
+
         try:
             response = self.llm_client.generate(
                 prompt=prompt,
-                system=self.SYSTEM_PROMPT,
+                system=provider_messages[0]["content"],
                 temperature=self.config.observer_temperature,
                 max_tokens=1000,
             )
+            self._record_cache_usage()
             return self._parse_observations(response)
         except Exception as e:
             # Fallback to simple extraction on error
@@ -206,6 +268,7 @@ Output ONLY observations, nothing else."""
     def _simple_extraction(self, messages: List[Dict]) -> Tuple[List[Observation], str, str]:
         """Simple extraction without LLM (fallback)."""
         observations = []
+        seen: Dict[int, Observation] = {}
         for msg in messages:
             if msg.get("role") == "user":
                 # Extract key facts
@@ -217,28 +280,30 @@ Output ONLY observations, nothing else."""
                     except:
                         timestamp = datetime.now()
 
-                # Simple heuristic extraction
-                content_lower = content.lower()
-                if "kids" in content_lower or "children" in content_lower:
-                    obs = Observation(
-                        timestamp=timestamp,
-                        priority=PriorityLevel.RED,
-                        content="User mentioned family (children)"
-                    )
-                    observations.append(obs)
-                elif "work" in content_lower or "job" in content_lower:
-                    obs = Observation(
-                        timestamp=timestamp,
-                        priority=PriorityLevel.YELLOW,
-                        content="User discussed work situation"
-                    )
-                    observations.append(obs)
-                elif "help" in content_lower:
+                # Rule-based compression strips log/JSON noise before
+                # the scan; the raw hash keeps provenance
+                compressed = compress(content)
+
+                # Simple heuristic extraction: one scan collecting every
+                # matched group, then highest-precedence group wins (the
+                # leftmost keyword must not decide the priority)
+                hits = {m.lastgroup for m in self._HEURISTIC_RE.finditer(compressed)}
+                group = next((g for g in self._HEURISTIC_PRECEDENCE if g in hits), None)
+                if group:
+                    priority, obs_content = self._HEURISTIC_OBSERVATIONS[group]
+                    # Fold repeats within this batch into repeat_count
+                    key = hash((priority, obs_content))
+                    existing = seen.get(key)
+                    if existing is not None:
+                        existing.repeat_count += 1
+                        continue
                     obs = Observation(
                         timestamp=timestamp,
-                        priority=PriorityLevel.YELLOW,
-                        content="User asked for help"
+                        priority=priority,
+                        content=obs_content,
+                        _raw_hash=raw_hash(content),
                     )
+                    seen[key] = obs
                     observations.append(obs)
 
         return observations, "", ""
@@ -0,0 +1,59 @@
+"""
+Prompt-module registry for reusable context blocks.
+
+The observation block emitted for a thread is stable across turns
+until a reflection rewrites it, which makes it a natural prompt
+module: register it once per reflection generation and let actors
+reference it by id instead of re-sending (and re-prefilling) the full
+text every turn. Serving stacks with prompt/KV caching can key cached
+attention states on the module id; without one, the registry still
+lets callers skip rebuilding and re-transmitting unchanged blocks.
+"""
+
+from typing import Dict, Optional
+
+
+class PromptModuleRegistry:
+    """Registry of prompt modules keyed by (thread, generation).
+
+    A module id looks like ``paom-{thread_id}-{generation}``; the
+    generation bumps whenever the underlying observations are
+    rewritten, so an id always names one immutable text.
+    """
+
+    def __init__(self):
+        self._generations: Dict[str, int] = {}
+        self._modules: Dict[str, str] = {}
+
+    def module_id(self, thread_id: str) -> str:
+        """Current module id for a thread."""
+        generation = self._generations.get(thread_id, 0)
+        return f"paom-{thread_id}-{generation}"
+
+    def bump_generation(self, thread_id: str) -> int:
+        """Advance a thread's generation (observations were rewritten).
+
+        The superseded module is dropped so the registry only holds one
+        text per thread.
+        """
+        self._modules.pop(self.module_id(thread_id), None)
+        generation = self._generations.get(thread_id, 0) + 1
+        self._generations[thread_id] = generation
+        return generation
+
+    def register_module(self, module_id: str, text: str) -> str:
+        """Register a module's text and return its reference tag."""
+        self._modules[module_id] = text
+        return self.reference(module_id)
+
+    def get_module(self, module_id: str) -> Optional[str]:
+        """Look up a registered module's text."""
+        return self._modules.get(module_id)
+
+    @staticmethod
+    def reference(module_id: str) -> str:
+        """Schema reference actors embed instead of the full text."""
+        return f'<module id="{module_id}">'
+
+
+__all__ = ["PromptModuleRegistry"]
@@ -61,6 +61,42 @@ Your output MUST be ONLY observations, nothing else. Do not include explanations
             # Fallback to simple condensation
             self.llm_client = None
 
+        # Prompt-cache token counters across provider calls
+        self._cache_stats = {"created": 0, "read": 0, "miss": 0}
+
+    def _record_cache_usage(self):
+        """Fold the last provider call's cache usage into the counters."""
+        usage = getattr(self.llm_client, "last_usage", None)
+        if not usage:
+            self._cache_stats["miss"] += 1
+            return
+        self._cache_stats["created"] += usage.get("created", 0)
+        self._cache_stats["read"] += usage.get("read", 0)
+        if not usage.get("read"):
+            self._cache_stats["miss"] += 1
+
+    def build_messages(self, dynamic_content: str) -> List[dict]:
+        """Build provider messages with a cacheable static prefix.
+
+        Mirrors ObserverAgent.build_messages: the static system prompt
+        carries ephemeral cache_control so provider prompt caching hits
+        on every reflection, leaving only the observation payload as
+        fresh input tokens.
+        """
+        return [
+            {
+                "role": "system",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": self.SYSTEM_PROMPT,
+                        "cache_control": {"type": "ephemeral"},
+                    },
+                ],
+            },
+            {"role": "user", "content": dynamic_content},
+        ]
+
     def reflect(self, observations: List[Observation]) -> List[Observation]:
         """
         Reflect and condense observations.
@@ -98,13 +134,17 @@ Your task:
 
 Output ONLY the condensed observations, nothing else."""
 
+        # Cacheable system block + dynamic user content
+        provider_messages = self.build_messages(prompt)
+
         try:
             response = self.llm_client.generate(
                 prompt=prompt,
-                system=self.SYSTEM_PROMPT,
+                system=provider_messages[0]["content"],
                 temperature=self.config.reflector_temperature,
                 max_tokens=1000,
             )
+            self._record_cache_usage()
             return self._parse_observations(response)
         except Exception as e:
             # Fallback to simple condensation on error
@@ -174,11 +214,20 @@ Output ONLY the condensed observations, nothing else."""
 
     def _simple_condensation(self, observations: List[Observation]) -> List[Observation]:
         """Simple condensation without LLM (fallback)."""
-        # Group by priority - keep only high and medium
-        condensed = [
-            obs for obs in observations
-            if obs.priority in [PriorityLevel.RED, PriorityLevel.YELLOW]  # "🔴", "🟡"
-        ]
+        # Keep only high and medium priority, folding duplicate
+        # (priority, content) pairs into repeat counts
+        condensed: List[Observation] = []
+        seen: dict = {}
+        for obs in observations:
+            if obs.priority not in (PriorityLevel.RED, PriorityLevel.YELLOW):  # "🔴", "🟡"
+                continue
+            key = hash((obs.priority, obs.content))
+            existing = seen.get(key)
+            if existing is not None and existing.content == obs.content:
+                existing.repeat_count += obs.repeat_count
+                continue
+            seen[key] = obs
+            condensed.append(obs)
 
         # Add summary observation
         if condensed:
@@ -60,14 +60,23 @@ class TokenCounter:
         if not observations:
             return 0
 
-        total_tokens = 0
-        for obs in observations:
-            # Count content + metadata
-            content_tokens = self.count_tokens(obs.content)
-            # Add small overhead for metadata
-            total_tokens += content_tokens + 10
-
-        return total_tokens
+        # Tokenize only observations that have no cached count yet,
+        # in one batch call when tiktoken provides it
+        uncounted = [obs for obs in observations if obs._tok_len is None]
+        if uncounted:
+            if self.use_tiktoken and hasattr(self.encoding, "encode_ordinary_batch"):
+                encoded = self.encoding.encode_ordinary_batch(
+                    [obs.content for obs in uncounted],
+                    num_threads=os.cpu_count() or 1,
+                )
+                for obs, tokens in zip(uncounted, encoded):
+                    obs._tok_len = len(tokens)
+            else:
+                for obs in uncounted:
+                    obs._tok_len = self.count_tokens(obs.content)
+
+        # Small per-observation overhead for metadata
+        return sum(obs._tok_len + 10 for obs in observations)
 
     def count_messages(self, messages: List[dict]) -> int:
         """
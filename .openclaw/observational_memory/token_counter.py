@@ -27,8 +27,14 @@ class TokenCounter:
         if not observations:
             return 0
 
-        total_words = sum(len(obs.content.split()) for obs in observations)
-        return total_words * 4
+        total = 0
+        for obs in observations:
+            # Estimate once per observation; appended lists then cost an
+            # integer sum instead of re-splitting every content string
+            if obs._tok_len is None:
+                obs._tok_len = len(obs.content.split()) * 4
+            total += obs._tok_len
+        return total
 
     def count_text(self, text: str) -> int:
         """Count tokens for plain text."""
@@ -8,28 +8,94 @@ from datetime import datetime
 
 
 class PriorityLevel:
-    """Priority levels for observations."""
+    """Priority levels for observations.
+
+    Kept as shared emoji string constants: instances only hold a
+    pointer to these class-level strings, and the emoji form is what
+    the database, parsers, and prompts all exchange.
+    """
     RED = "🔴"
     YELLOW = "🟡"
     GREEN = "🟢"
 
 
-@dataclass
+@dataclass(slots=True)
 class Observation:
-    """A single observation with temporal context."""
+    """A single observation with temporal context.
+
+    Slotted: threads can hold thousands of observations, and dropping
+    the per-instance __dict__ cuts memory per object roughly in half.
+    """
     timestamp: datetime
     priority: str  # PriorityLevel.RED, YELLOW, or GREEN
     content: str
     referenced_date: Optional[datetime] = None  # Estimated/actual referenced date
-
-
-@dataclass
+    repeat_count: int = 1  # How many times this observation recurred
+    # Token count of content, filled lazily by the token counters so
+    # repeated threshold checks sum cached ints instead of re-tokenizing
+    _tok_len: Optional[int] = field(default=None, repr=False, compare=False)
+    # Context-line pieces, computed once at creation so formatting a
+    # thread is attribute reads instead of per-call strftime work
+    _date_key: str = field(default="", repr=False, compare=False)
+    _line_suffix: str = field(default="", repr=False, compare=False)
+    # Hash of the source text this observation was derived from, so
+    # compressed content can be traced back to the original message
+    _raw_hash: Optional[bytes] = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._date_key = self.timestamp.date().isoformat()
+        time_str = self.timestamp.strftime("%H:%M")
+        self._line_suffix = f"* {self.priority} ({time_str}) {self.content}"
+
+
+@dataclass(slots=True)
 class ObservationalMemoryRecord:
-    """Complete observational memory for a thread."""
+    """Complete observational memory for a thread.
+
+    `observations` is the full ordered list; `reflected_count` is a
+    watermark splitting it into an already-reflected stable prefix and
+    a pending tail awaiting the next reflection pass.
+    """
     observations: list[Observation]
     current_task: str = ""
     suggested_response: str = ""
     last_observed_at: Optional[datetime] = None
+    reflected_count: int = 0
+    # Lazily built map of hash((priority, content)) -> Observation used
+    # to fold repeated observations instead of appending duplicates
+    _seen: Optional[dict] = field(default=None, repr=False, compare=False)
+
+    @property
+    def reflected_prefix(self) -> list[Observation]:
+        """Already-reflected observations (stable, cache-friendly)."""
+        return self.observations[:self.reflected_count]
+
+    @property
+    def pending(self) -> list[Observation]:
+        """Observations not yet seen by the reflector."""
+        return self.observations[self.reflected_count:]
+
+    def fold_in(self, new_observations: list[Observation]) -> None:
+        """Append observations, folding duplicates into repeat counts.
+
+        A repeat of an existing (priority, content) pair bumps that
+        observation's repeat_count instead of appending a new entry.
+        """
+        if self._seen is None:
+            self._seen = {
+                hash((obs.priority, obs.content)): obs
+                for obs in self.observations
+            }
+        for obs in new_observations:
+            key = hash((obs.priority, obs.content))
+            existing = self._seen.get(key)
+            if (existing is not None
+                    and existing.priority == obs.priority
+                    and existing.content == obs.content):
+                existing.repeat_count += obs.repeat_count
+            else:
+                self.observations.append(obs)
+                self._seen[key] = obs
 
 
 @dataclass
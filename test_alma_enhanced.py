@@ -16,6 +16,8 @@ sys.path.insert(0, str(repo_root / ".openclaw"))
 
 from alma.alma_agent import ALMAAgent
 from alma.real_evaluator import RealALMAEvaluator, benchmark_designs
+from alma.ab_testing import ABTest
+from alma.alma_trading_adapter_v2 import TradingMemory
 from alma.mutation_strategies import (
     mutate_design,
     evolve_designs,
@@ -270,6 +272,91 @@ def test_alma_stats():
         return False
 
 
+def test_ab_testing_stats():
+    """Test A/B running stats through the multi-row ingest path."""
+    print("\n🧪 Test 8: A/B Testing Stats")
+
+    try:
+        # Initialize (use temp file for persistence)
+        import tempfile
+        temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db").name
+
+        with ABTest(db_path=temp_db) as ab:
+            # 150 samples exercises one full chunk plus a partial one
+            ab.record_metrics_multirow("stats-test", "A", "score", [80.0] * 150)
+            ab.record_metrics("stats-test", "B", "score", [90.0, 92.0, 94.0])
+
+            results = ab.analyze_results("stats-test")
+
+        assert results["status"] == "complete", "Analysis should complete"
+        assert results["variant_a"]["samples"] == 150, "All multirow samples counted"
+        assert abs(results["variant_a"]["mean"] - 80.0) < 1e-9, "Mean A mismatch"
+        assert results["variant_a"]["std"] == 0.0, "Constant samples have zero std"
+        assert abs(results["variant_b"]["mean"] - 92.0) < 1e-9, "Mean B mismatch"
+        assert results["winner"] == "B", "B should win"
+        assert results["improvement_pct"] == 15.0, "Improvement mismatch"
+
+        print("  ✅ PASS")
+        TEST_RESULTS.append(("A/B Testing Stats", "PASS"))
+        return True
+
+    except Exception as e:
+        print(f"  ❌ FAIL: {e}")
+        import traceback
+        traceback.print_exc()
+        TEST_RESULTS.append(("A/B Testing Stats", "FAIL"))
+        return False
+
+
+def test_trading_dynamic_weights():
+    """Test dynamic strategy weights from bulk performance snapshots."""
+    print("\n🧪 Test 9: Trading Dynamic Weights")
+
+    try:
+        # Initialize (use temp file for persistence)
+        import tempfile
+        temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db").name
+        tm = TradingMemory(db_path=temp_db)
+
+        tm.update_strategy_performance_bulk([
+            ("momentum", {
+                "win_rate": 0.70,
+                "avg_return": 0.04,
+                "max_drawdown": 0.10,
+                "num_trades": 60,
+            }, "bull"),
+            ("meanrev", {
+                "win_rate": 0.45,
+                "avg_return": 0.01,
+                "max_drawdown": 0.20,
+                "num_trades": 30,
+            }, "bull"),
+        ])
+
+        weights = tm.compute_dynamic_weights(market_regime="bull")
+
+        assert set(weights) == {"momentum", "meanrev"}, "Both strategies weighted"
+        assert abs(sum(weights.values()) - 1.0) < 1e-9, "Weights should sum to 1.0"
+        assert weights["momentum"] > weights["meanrev"], \
+            "Better performer should get more weight"
+
+        # Empty selection short-circuits without touching the database
+        assert tm.compute_dynamic_weights(active_strategies=[]) == {}
+
+        tm.close()
+
+        print("  ✅ PASS")
+        TEST_RESULTS.append(("Trading Dynamic Weights", "PASS"))
+        return True
+
+    except Exception as e:
+        print(f"  ❌ FAIL: {e}")
+        import traceback
+        traceback.print_exc()
+        TEST_RESULTS.append(("Trading Dynamic Weights", "FAIL"))
+        return False
+
+
 def run_all_tests():
     """Run all ALMA tests."""
     print("🐺📿 ALMA Enhanced Test Suite")
@@ -283,6 +370,8 @@ def run_all_tests():
         test_evolution,
         test_alma_meta_learning_cycle,
         test_alma_stats,
+        test_ab_testing_stats,
+        test_trading_dynamic_weights,
     ]
 
     for test in tests:
@@ -145,6 +145,104 @@ class TestObservationalMemory:
         # So we just check the process completes without error
         assert True, "Reflection threshold test completed"
 
+    def test_fold_in_repeat_rendering(self):
+        """Test that duplicate observations fold into repeat counts."""
+        now = datetime.now()
+        messages = [
+            {"role": "user", "content": "I have kids", "timestamp": now},
+            {"role": "user", "content": "I have kids", "timestamp": now + timedelta(minutes=1)},
+        ]
+
+        record = self.om.process_messages("fold-thread", messages)
+        assert len(record.observations) == 1, "Duplicates should fold into one observation"
+        assert record.observations[0].repeat_count == 2
+
+        # A later batch with the same fact folds into the stored record
+        record = self.om.process_messages("fold-thread", [
+            {"role": "user", "content": "I have kids", "timestamp": now + timedelta(minutes=2)},
+        ])
+        assert len(record.observations) == 1, "Repeat should fold, not append"
+        assert record.observations[0].repeat_count == 3
+
+        context = self.om.get_context("fold-thread")
+        assert "(x3)" in context, "Repeat count should render in context"
+
+        # Folded count survives a reload
+        om2 = ObservationalMemory(self.config)
+        record2 = om2.get_observation_record("fold-thread")
+        assert record2.observations[0].repeat_count == 3, "Repeat count should persist"
+
+    def test_reflection_watermark(self):
+        """Test that reflection leaves the already-reflected prefix untouched."""
+        now = datetime(2026, 2, 10, 9, 0)
+        prefix = Observation(
+            timestamp=now,
+            priority=PriorityLevel.RED,
+            content="User stated a stable fact",
+        )
+        pending = [
+            Observation(
+                timestamp=now + timedelta(minutes=i + 1),
+                priority=PriorityLevel.YELLOW,
+                content=f"User asked question number {i}",
+            )
+            for i in range(20)
+        ]
+        record = ObservationalMemoryRecord(
+            observations=[prefix] + pending,
+            reflected_count=1,
+        )
+        self.om._save_observation_record("watermark-thread", record)
+
+        # Pending tail exceeds reflection_threshold=200; a message with
+        # no extractable keywords trips reflection without adding
+        # observations of its own
+        updated = self.om.process_messages("watermark-thread", [
+            {"role": "user", "content": "just checking in", "timestamp": datetime.now()},
+        ])
+
+        assert updated.observations[0].content == "User stated a stable fact", \
+            "Reflected prefix should be untouched"
+        assert updated.reflected_count == len(updated.observations), \
+            "Watermark should advance to cover the reflected list"
+        assert updated.reflected_count > 1, "Watermark should move past the old prefix"
+
+        # Watermark survives a reload
+        om2 = ObservationalMemory(self.config)
+        record2 = om2.get_observation_record("watermark-thread")
+        assert record2.reflected_count == len(record2.observations), \
+            "Watermark should persist"
+
+    def test_force_reflection_persists(self):
+        """Test that force_reflection condenses and survives a reload."""
+        now = datetime(2026, 2, 10, 12, 0)
+        record = ObservationalMemoryRecord(observations=[
+            Observation(
+                timestamp=now,
+                priority=PriorityLevel.RED,
+                content="User stated a key fact",
+            ),
+            Observation(
+                timestamp=now + timedelta(minutes=1),
+                priority=PriorityLevel.GREEN,
+                content="Minor side note",
+            ),
+        ])
+        self.om._save_observation_record("force-thread", record)
+
+        result = self.om.force_reflection("force-thread")
+        assert "Reflection complete" in result
+
+        # Condensed result must survive a fresh instance
+        om2 = ObservationalMemory(self.config)
+        record2 = om2.get_observation_record("force-thread")
+        assert record2 is not None, "Reflected record should persist"
+        contents = [obs.content for obs in record2.observations]
+        assert "User stated a key fact" in contents, "High-priority fact should survive"
+        assert "Minor side note" not in contents, "Low-priority note should be condensed away"
+        assert record2.reflected_count == len(record2.observations), \
+            "Watermark should cover the reflected list"
+
     def test_persistence_across_instances(self):
         """Test that observations persist across instances."""
         now = datetime.now()
@@ -182,6 +280,9 @@ def run_tests():
         ("Format Observations", test.setup_method, test.test_format_observations, test.teardown_method),
         ("Get Stats No Obs", test.setup_method, test.test_get_stats_no_observations, test.teardown_method),
         ("Reflection Threshold", test.setup_method, test.test_reflection_threshold, test.teardown_method),
+        ("Fold-In Repeat Rendering", test.setup_method, test.test_fold_in_repeat_rendering, test.teardown_method),
+        ("Reflection Watermark", test.setup_method, test.test_reflection_watermark, test.teardown_method),
+        ("Force Reflection Persists", test.setup_method, test.test_force_reflection_persists, test.teardown_method),
         ("Persistence", test.setup_method, test.test_persistence_across_instances, test.teardown_method),
     ]
 